@@ -281,6 +281,11 @@ WA_STATEMENT_TEMPLATE = config("WA_STATEMENT_TEMPLATE", default="statement")
 WA_PAYMENT_TEMPLATE = config("WA_PAYMENT_TEMPLATE", default="payment_recived")
 WA_BALANCE_TEMPLATE = config("WA_BALANCE_TEMPLATE", default="balance")
 
+# Rows per INSERT when writing InventoryLog entries in bulk
+INVENTORY_LOG_BULK_BATCH_SIZE = config(
+    "INVENTORY_LOG_BULK_BATCH_SIZE", default=5000, cast=int
+)
+
 
 class MaxLevelFilter(logging.Filter):
     """Filter to limit log level."""
@@ -290,7 +290,7 @@ def get_inventory_comparison_data(date_filter, current_start, current_end):
     )
 
     current_logs = InventoryLog.objects.filter(
-        variant__is_deleted=False,
+        variant_is_deleted=False,
         timestamp__date__range=[current_start, current_end],
     )
     current_data = _get_inventory_period_data(
@@ -298,7 +298,7 @@ def get_inventory_comparison_data(date_filter, current_start, current_end):
     )
 
     previous_logs = InventoryLog.objects.filter(
-        variant__is_deleted=False,
+        variant_is_deleted=False,
         timestamp__date__range=[previous_start, previous_end],
     )
     previous_data = _get_inventory_period_data(
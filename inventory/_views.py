@@ -11,6 +11,7 @@ AJAX endpoints for search suggestions, paginated fetching, and modal-based creat
 import logging
 
 from django.contrib import messages
+from django.db import IntegrityError, transaction
 from django.db.models import Q
 from django.http import JsonResponse
 from django.shortcuts import render
@@ -62,6 +63,29 @@ def create_ajax_response(success=True, message="", data=None):
     return JsonResponse(response)
 
 
+class UniqueSaveMixin:
+    """
+    Save the form atomically and report unique-constraint races as form errors.
+
+    The forms rely on the models' unique constraints instead of running their
+    own duplicate queries, so a concurrent insert surfaces as IntegrityError.
+    """
+
+    success_message = ""
+    duplicate_message = "A record with these details already exists."
+
+    def form_valid(self, form):
+        try:
+            with transaction.atomic():
+                response = super().form_valid(form)
+        except IntegrityError:
+            form.add_error(None, self.duplicate_message)
+            return self.form_invalid(form)
+        if self.success_message:
+            messages.success(self.request, self.success_message)
+        return response
+
+
 @required_permission("inventory.view_clothtype")
 def cloth_home(request):
     """List all cloth types"""
@@ -74,7 +98,7 @@ def cloth_home(request):
     return render(request, "inventory/cloth/home.html", context)
 
 
-class CreateClothType(RequiredPermissionMixin, CreateView):
+class CreateClothType(RequiredPermissionMixin, UniqueSaveMixin, CreateView):
     """CBV to create a new cloth type record."""
 
     required_permission = "inventory.add_clothtype"
@@ -82,6 +106,7 @@ class CreateClothType(RequiredPermissionMixin, CreateView):
     model = ClothType
     form_class = ClothTypeForm
     template_name = "inventory/cloth/form.html"
+    success_message = "Cloth type created successfully"
 
     def get_success_url_name(self):  # noqa: D102
         """Return the URL name to redirect to after successful creation."""
@@ -92,17 +117,13 @@ class CreateClothType(RequiredPermissionMixin, CreateView):
         context["title"] = "Create Cloth Type"
         return context
 
-    def form_valid(self, form):
-        messages.success(self.request, "Cloth type created successfully")
-        return super().form_valid(form)
-
     def form_invalid(self, form):
         logger.error("Form invalid: %s", form.errors)
         messages.error(self.request, "Please correct the errors below.")
         return super().form_invalid(form)
 
 
-class UpdateClothType(RequiredPermissionMixin, UpdateView):
+class UpdateClothType(RequiredPermissionMixin, UniqueSaveMixin, UpdateView):
     """CBV to update an existing cloth type record."""
 
     required_permission = "inventory.change_clothtype"
@@ -110,10 +131,7 @@ class UpdateClothType(RequiredPermissionMixin, UpdateView):
     model = ClothType
     form_class = ClothTypeForm
     template_name = "inventory/cloth/form.html"
-
-    def form_valid(self, form):
-        messages.success(self.request, "Cloth type updated successfully")
-        return super().form_valid(form)
+    success_message = "Cloth type updated successfully"
 
     def get_success_url(self):
         return reverse("inventory:cloth_home")
@@ -157,7 +175,7 @@ def color_home(request):
     return render(request, "inventory/color/home.html", context)
 
 
-class CreateColor(RequiredPermissionMixin, CreateView):
+class CreateColor(RequiredPermissionMixin, UniqueSaveMixin, CreateView):
     """CBV to create a new color record."""
 
     required_permission = "inventory.add_color"
@@ -165,6 +183,7 @@ class CreateColor(RequiredPermissionMixin, CreateView):
     model = Color
     form_class = ColorForm
     template_name = "inventory/color/form.html"
+    success_message = "Color created successfully"
 
     def get_success_url_name(self):  # noqa: D102
         """Return the URL name to redirect to after successful creation."""
@@ -175,17 +194,13 @@ class CreateColor(RequiredPermissionMixin, CreateView):
         context["title"] = "Create Color"
         return context
 
-    def form_valid(self, form):
-        messages.success(self.request, "Color created successfully")
-        return super().form_valid(form)
-
     def form_invalid(self, form):
         logger.error("Form invalid: %s", form.errors)
         messages.error(self.request, "Please correct the errors below.")
         return super().form_invalid(form)
 
 
-class UpdateColor(RequiredPermissionMixin, UpdateView):
+class UpdateColor(RequiredPermissionMixin, UniqueSaveMixin, UpdateView):
     """CBV to update an existing color record."""
 
     required_permission = "inventory.change_color"
@@ -193,10 +208,7 @@ class UpdateColor(RequiredPermissionMixin, UpdateView):
     model = Color
     form_class = ColorForm
     template_name = "inventory/color/form.html"
-
-    def form_valid(self, form):
-        messages.success(self.request, "Color updated successfully")
-        return super().form_valid(form)
+    success_message = "Color updated successfully"
 
     def get_success_url(self):
         return reverse("inventory:color_home")
@@ -240,7 +252,7 @@ def size_home(request):
     return render(request, "inventory/size/home.html", context)
 
 
-class CreateSize(RequiredPermissionMixin, CreateView):
+class CreateSize(RequiredPermissionMixin, UniqueSaveMixin, CreateView):
     """CBV to create a new size record."""
 
     required_permission = "inventory.add_size"
@@ -248,6 +260,7 @@ class CreateSize(RequiredPermissionMixin, CreateView):
     model = Size
     form_class = SizeForm
     template_name = "inventory/size/form.html"
+    success_message = "Size created successfully"
 
     def get_success_url_name(self):  # noqa: D102
         """Return the URL name to redirect to after successful creation."""
@@ -258,17 +271,13 @@ class CreateSize(RequiredPermissionMixin, CreateView):
         context["title"] = "Create Size"
         return context
 
-    def form_valid(self, form):
-        messages.success(self.request, "Size created successfully")
-        return super().form_valid(form)
-
     def form_invalid(self, form):
         logger.error("Form invalid: %s", form.errors)
         messages.error(self.request, "Please correct the errors below.")
         return super().form_invalid(form)
 
 
-class UpdateSize(RequiredPermissionMixin, UpdateView):
+class UpdateSize(RequiredPermissionMixin, UniqueSaveMixin, UpdateView):
     """CBV to update an existing size record."""
 
     required_permission = "inventory.change_size"
@@ -276,10 +285,7 @@ class UpdateSize(RequiredPermissionMixin, UpdateView):
     model = Size
     form_class = SizeForm
     template_name = "inventory/size/form.html"
-
-    def form_valid(self, form):
-        messages.success(self.request, "Size updated successfully")
-        return super().form_valid(form)
+    success_message = "Size updated successfully"
 
     def get_success_url(self):
         return reverse("inventory:size_home")
@@ -410,7 +416,7 @@ def category_home(request):
     return render(request, "inventory/category/home.html")
 
 
-class CreateCategory(RequiredPermissionMixin, CreateView):
+class CreateCategory(RequiredPermissionMixin, UniqueSaveMixin, CreateView):
     """CBV to create a new category record."""
 
     required_permission = "inventory.add_category"
@@ -418,6 +424,7 @@ class CreateCategory(RequiredPermissionMixin, CreateView):
     model = Category
     form_class = CategoryForm
     template_name = "inventory/category/form.html"
+    success_message = "Category created successfully"
 
     def get_success_url(self):
         return reverse("inventory:category_home")
@@ -427,17 +434,13 @@ class CreateCategory(RequiredPermissionMixin, CreateView):
         context["title"] = "Create Category"
         return context
 
-    def form_valid(self, form):
-        messages.success(self.request, "Category created successfully")
-        return super().form_valid(form)
-
     def form_invalid(self, form):
         messages.error(self.request, "Please correct the errors below.")
         logger.error("Form invalid: %s", form.errors)
         return super().form_invalid(form)
 
 
-class UpdateCategory(RequiredPermissionMixin, UpdateView):
+class UpdateCategory(RequiredPermissionMixin, UniqueSaveMixin, UpdateView):
     """CBV to update an existing category record."""
 
     required_permission = "inventory.change_category"
@@ -445,10 +448,7 @@ class UpdateCategory(RequiredPermissionMixin, UpdateView):
     model = Category
     form_class = CategoryForm
     template_name = "inventory/category/form.html"
-
-    def form_valid(self, form):
-        messages.success(self.request, "Category updated successfully")
-        return super().form_valid(form)
+    success_message = "Category updated successfully"
 
     def get_success_url(self):
         return reverse("inventory:category_home")
@@ -493,7 +493,7 @@ def uom_home(request):
     return render(request, "inventory/uom/home.html")
 
 
-class CreateUOM(RequiredPermissionMixin, CreateView):
+class CreateUOM(RequiredPermissionMixin, UniqueSaveMixin, CreateView):
     """CBV to create a new unit of measurement record."""
 
     required_permission = "inventory.add_uom"
@@ -501,6 +501,7 @@ class CreateUOM(RequiredPermissionMixin, CreateView):
     model = UOM
     form_class = UOMForm
     template_name = "inventory/uom/form.html"
+    success_message = "UOM created successfully"
 
     def get_success_url_name(self):  # noqa: D102
         """Return the URL name to redirect to after successful creation."""
@@ -511,17 +512,13 @@ class CreateUOM(RequiredPermissionMixin, CreateView):
         context["title"] = "Create UOM"
         return context
 
-    def form_valid(self, form):
-        messages.success(self.request, "UOM created successfully")
-        return super().form_valid(form)
-
     def form_invalid(self, form):
         logger.error("Form invalid: %s", form.errors)
         messages.error(self.request, "Please correct the errors below.")
         return super().form_invalid(form)
 
 
-class UpdateUOM(RequiredPermissionMixin, UpdateView):
+class UpdateUOM(RequiredPermissionMixin, UniqueSaveMixin, UpdateView):
     """CBV to update an existing unit of measurement record."""
 
     required_permission = "inventory.change_uom"
@@ -529,10 +526,7 @@ class UpdateUOM(RequiredPermissionMixin, UpdateView):
     model = UOM
     form_class = UOMForm
     template_name = "inventory/uom/form.html"
-
-    def form_valid(self, form):
-        messages.success(self.request, "UOM updated successfully")
-        return super().form_valid(form)
+    success_message = "UOM updated successfully"
 
     def get_success_url(self):
         return reverse("inventory:uom_home")
@@ -776,7 +770,7 @@ def gst_hsn_home(request):
     return render(request, "inventory/gst_hsn/home.html", context)
 
 
-class CreateGSTHsnCode(RequiredPermissionMixin, CreateView):
+class CreateGSTHsnCode(RequiredPermissionMixin, UniqueSaveMixin, CreateView):
     """CBV to create a new GST HSN code record."""
 
     required_permission = "inventory.add_gsthsncode"
@@ -784,6 +778,7 @@ class CreateGSTHsnCode(RequiredPermissionMixin, CreateView):
     model = GSTHsnCode
     form_class = GSTHsnCodeForm
     template_name = "inventory/gst_hsn/form.html"
+    success_message = "GST HSN code created successfully"
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
@@ -793,17 +788,13 @@ class CreateGSTHsnCode(RequiredPermissionMixin, CreateView):
     def get_success_url(self):
         return reverse("inventory:gst_hsn_home")
 
-    def form_valid(self, form):
-        messages.success(self.request, "GST HSN code created successfully")
-        return super().form_valid(form)
-
     def form_invalid(self, form):
         logger.error("Form invalid: %s", form.errors)
         messages.error(self.request, "Please correct the errors below.")
         return super().form_invalid(form)
 
 
-class UpdateGSTHsnCode(RequiredPermissionMixin, UpdateView):
+class UpdateGSTHsnCode(RequiredPermissionMixin, UniqueSaveMixin, UpdateView):
     """CBV to update an existing GST HSN code record."""
 
     required_permission = "inventory.change_gsthsncode"
@@ -5,8 +5,31 @@ with the Django admin site and configures list displays, filters, search,
 fieldsets, inlines, and custom admin actions.
 """
 
-from django.contrib import admin
-
+from itertools import islice
+
+from django.contrib import admin, messages
+from django.contrib.admin import helpers
+from django.contrib.admin.views.main import ChangeList
+from django.core.paginator import Paginator
+from django.db.models import (
+    Case,
+    CharField,
+    DecimalField,
+    ExpressionWrapper,
+    F,
+    Q,
+    Value,
+    When,
+)
+from django.db.models.functions import Concat
+from django.forms.models import BaseInlineFormSet
+from django.template.response import TemplateResponse
+
+from .forms import (
+    BulkQuantityAdjustmentForm,
+    InventoryLogAdminForm,
+    ProductVariantAdminForm,
+)
 from .models import (
     Category,
     ClothType,
@@ -17,8 +40,10 @@ from .models import (
     Product,
     ProductVariant,
     Size,
+    SupplierInvoice,
     VariantMedia,
 )
+from .services import InventoryService
 
 
 @admin.register(Category)
@@ -105,7 +130,7 @@ class ProductAdmin(admin.ModelAdmin):
         "created_at",
         "updated_at",
     ]
-    search_fields = ["name", "brand", "description", "hsn_code"]
+    search_fields = ["name", "brand", "description", "hsn_code__code"]
     ordering = ["brand", "name"]
     readonly_fields = ["created_at", "updated_at"]
     inlines = []
@@ -121,10 +146,22 @@ class ProductAdmin(admin.ModelAdmin):
     )
 
 
+class RecentInventoryLogFormSet(BaseInlineFormSet):
+    """Inline formset that only loads the latest ``limit`` logs for a variant."""
+
+    limit = 10
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Slice after the FK filter so the LIMIT is applied by the database
+        self.queryset = self.queryset.order_by("-timestamp")[: self.limit]
+
+
 class InventoryLogInline(admin.TabularInline):
     """Inline admin for InventoryLog within ProductVariantAdmin."""
 
     model = InventoryLog
+    formset = RecentInventoryLogFormSet
     extra = 0
     readonly_fields = [
         "timestamp",
@@ -143,17 +180,47 @@ class InventoryLogInline(admin.TabularInline):
         "notes",
     ]
     can_delete = False
-    max_num = 10
+    max_num = RecentInventoryLogFormSet.limit
+
+    def get_queryset(self, request):
+        """Load only the columns rendered by the inline."""
+        return (
+            super()
+            .get_queryset(request)
+            .select_related("created_by")
+            .only(
+                "variant",
+                "timestamp",
+                "created_by",
+                "transaction_type",
+                "quantity_change",
+                "new_quantity",
+                "total_value",
+                "notes",
+            )
+        )
 
     def has_add_permission(self, request, obj=None):
         """Prevent adding inventory logs directly via inline."""
         return False
 
 
+class ProductVariantChangeList(ChangeList):
+    """Changelist that loads only the columns rendered by ``list_display``."""
+
+    def get_queryset(self, request, exclude_parameters=None):
+        return (
+            super()
+            .get_queryset(request, exclude_parameters)
+            .only(*self.model_admin.changelist_only_fields)
+        )
+
+
 @admin.register(ProductVariant)
 class ProductVariantAdmin(admin.ModelAdmin):
     """Admin configuration for the ProductVariant model."""
 
+    form = ProductVariantAdminForm
     list_display = [
         "get_product_name",
         "barcode",
@@ -163,17 +230,38 @@ class ProductVariantAdmin(admin.ModelAdmin):
         "damaged_quantity",
         "purchase_price",
         "mrp",
-        "final_price",
-        "stock_status",
+        "get_final_price",
+        "get_total_value",
+        "get_stock_status",
+        "status",
+        "created_at",
+    ]
+    # An explicit list stops the changelist from replacing the joins below
+    # with a bare select_related(), which skips the nullable size/color FKs
+    list_select_related = ["product", "size", "color"]
+    # Skip the unfiltered COUNT(*) the changelist runs alongside the filtered one
+    show_full_result_count = False
+    changelist_only_fields = [
+        "product__brand",
+        "product__name",
+        "size__name",
+        "color__name",
+        "barcode",
+        "extra_attributes",  # read by __str__ for the action checkbox label
+        "quantity",
+        "damaged_quantity",
+        "minimum_quantity",
+        "purchase_price",
+        "mrp",
         "status",
         "created_at",
     ]
     list_filter = [
         "status",
-        "product__category",
-        "product__cloth_type",
-        "size",
-        "color",
+        ("product__category", admin.RelatedOnlyFieldListFilter),
+        ("product__cloth_type", admin.RelatedOnlyFieldListFilter),
+        ("size", admin.RelatedOnlyFieldListFilter),
+        ("color", admin.RelatedOnlyFieldListFilter),
         "created_at",
         "updated_at",
     ]
@@ -198,6 +286,8 @@ class ProductVariantAdmin(admin.ModelAdmin):
         "damage_percentage",
     ]
     inlines = [VariantMediaInline, InventoryLogInline]
+    # Products are high-cardinality; load them on demand instead of a full <select>
+    autocomplete_fields = ["product"]
 
     fieldsets = (
         (
@@ -238,51 +328,201 @@ class ProductVariantAdmin(admin.ModelAdmin):
     )
 
     def get_product_name(self, obj):
-        """Return the display name for the product variant."""
-        return obj.get_name(include_barcode=False, include_variants=True)
+        """Return the database-built display name for the product variant."""
+        return obj.display_name_db
 
     get_product_name.short_description = "Product Name"
-    get_product_name.admin_order_field = "product__name"
+    get_product_name.admin_order_field = "display_name_db"
+
+    def get_final_price(self, obj):
+        """Return the database-computed price after discount."""
+        return obj.final_price_db
+
+    get_final_price.short_description = "Final Price"
+    get_final_price.admin_order_field = "final_price_db"
+
+    def get_total_value(self, obj):
+        """Return the database-computed stock value at purchase price."""
+        return obj.total_value_db
+
+    get_total_value.short_description = "Total Value"
+    get_total_value.admin_order_field = "total_value_db"
+
+    def get_stock_status(self, obj):
+        """Return the database-computed stock status label."""
+        return obj.stock_status_db
+
+    get_stock_status.short_description = "Stock Status"
+    get_stock_status.admin_order_field = "stock_status_db"
 
     def get_queryset(self, request):
-        """Optimize queryset with select_related for list display."""
+        """Optimize queryset with select_related and computed list columns."""
+        amount_field = DecimalField(max_digits=12, decimal_places=2)
         return (
             super()
             .get_queryset(request)
-            .select_related(
-                "product", "product__category", "product__cloth_type", "size", "color"
+            .select_related("product", "size", "color")
+            .annotate(
+                final_price_db=ExpressionWrapper(
+                    F("mrp") * (Value(100) - F("discount_percentage")) / Value(100),
+                    output_field=amount_field,
+                ),
+                total_value_db=ExpressionWrapper(
+                    F("quantity") * F("purchase_price"), output_field=amount_field
+                ),
+                # Mirrors ProductVariantStockMixin.stock_status
+                stock_status_db=Case(
+                    When(quantity=0, then=Value("Out of Stock")),
+                    When(
+                        minimum_quantity__gt=0,
+                        quantity__lte=F("minimum_quantity"),
+                        then=Value("Low Stock"),
+                    ),
+                    default=Value("In Stock"),
+                    output_field=CharField(),
+                ),
+                # Mirrors get_name(include_barcode=False); Concat treats the
+                # NULL size/color names as empty strings.
+                display_name_db=Concat(
+                    "product__brand",
+                    Case(
+                        When(product__name="", then=Value("")),
+                        default=Concat(Value(" - "), "product__name"),
+                    ),
+                    Case(
+                        When(size__isnull=True, color__isnull=True, then=Value("")),
+                        default=Value(", "),
+                    ),
+                    "size__name",
+                    Case(
+                        When(size__isnull=False, color__isnull=False, then=Value(", ")),
+                        default=Value(""),
+                    ),
+                    "color__name",
+                    output_field=CharField(),
+                ),
             )
         )
 
+    def get_changelist(self, request, **kwargs):
+        """Use the column-restricted changelist."""
+        return ProductVariantChangeList
+
+    def formfield_for_foreignkey(self, db_field, request, **kwargs):
+        """Load only the columns the size/color dropdown labels need."""
+        if db_field.name == "size":
+            kwargs["queryset"] = Size.objects.only("id", "name")
+        elif db_field.name == "color":
+            kwargs["queryset"] = Color.objects.only("id", "name")
+        return super().formfield_for_foreignkey(db_field, request, **kwargs)
+
     actions = ["mark_as_active", "mark_as_discontinued", "adjust_quantities"]
 
+    # Rows per UPDATE statement for bulk status actions
+    update_chunk_size = 10000
+
+    def _update_status_in_chunks(self, queryset, status):
+        """Update status in pk-chunked UPDATEs to keep lock windows short."""
+        pks = queryset.values_list("pk", flat=True).iterator(
+            chunk_size=self.update_chunk_size
+        )
+        updated = 0
+        while chunk := list(islice(pks, self.update_chunk_size)):
+            updated += ProductVariant.objects.filter(pk__in=chunk).update(
+                status=status
+            )
+        return updated
+
     def mark_as_active(self, request, queryset):
         """Bulk-mark selected variants as active."""
-        updated = queryset.update(status=ProductVariant.VariantStatus.ACTIVE)
+        updated = self._update_status_in_chunks(
+            queryset, ProductVariant.VariantStatus.ACTIVE
+        )
         self.message_user(request, f"{updated} variants marked as active.")
 
     mark_as_active.short_description = "Mark selected variants as active"
 
     def mark_as_discontinued(self, request, queryset):
         """Bulk-mark selected variants as discontinued."""
-        updated = queryset.update(status=ProductVariant.VariantStatus.DISCONTINUED)
+        updated = self._update_status_in_chunks(
+            queryset, ProductVariant.VariantStatus.DISCONTINUED
+        )
         self.message_user(request, f"{updated} variants marked as discontinued.")
 
     mark_as_discontinued.short_description = "Mark selected variants as discontinued"
 
-    def adjust_quantities(self, request, _queryset):
-        """Placeholder action for bulk quantity adjustment."""
-        self.message_user(
-            request, "Quantity adjustment feature would be implemented here."
+    def adjust_quantities(self, request, queryset):
+        """Collect per-variant deltas and apply them in a single UPDATE."""
+        if "apply" in request.POST:
+            form = BulkQuantityAdjustmentForm(request.POST, variants=queryset)
+            if form.is_valid():
+                try:
+                    adjusted = InventoryService.bulk_adjust_quantities(
+                        form.get_deltas(),
+                        user=request.user,
+                        notes=form.cleaned_data["notes"],
+                    )
+                except ValueError as e:
+                    self.message_user(request, str(e), messages.ERROR)
+                    return None
+                self.message_user(request, f"{adjusted} variants adjusted.")
+                return None
+        else:
+            form = BulkQuantityAdjustmentForm(variants=queryset)
+
+        context = {
+            **self.admin_site.each_context(request),
+            "title": "Adjust quantities",
+            "opts": self.model._meta,
+            "form": form,
+            "action_checkbox_name": helpers.ACTION_CHECKBOX_NAME,
+        }
+        return TemplateResponse(
+            request,
+            "admin/inventory/productvariant/adjust_quantities.html",
+            context,
         )
 
     adjust_quantities.short_description = "Adjust quantities for selected variants"
 
 
+class InventoryLogIndexOffsetPaginator(Paginator):
+    """
+    Paginator that finds a page's first ``(timestamp, pk)`` with a narrow OFFSET.
+
+    This is not keyset pagination: the admin links pages by number, so the
+    boundary key is still found with ``OFFSET (page - 1) * per_page``. That
+    OFFSET only walks ``inventory_log_ts_id_desc_idx`` (an index-only scan)
+    instead of full joined rows, and the page itself is then read with a
+    range predicate. Deep pages still cost time proportional to their offset.
+    Any ordering other than the default falls back to regular pagination.
+    """
+
+    index_ordering = ("-timestamp", "-pk")
+
+    def page(self, number):
+        number = self.validate_number(number)
+        queryset = self.object_list
+        ordering = tuple(dict.fromkeys(queryset.query.order_by))
+        if number == 1 or ordering != self.index_ordering:
+            return super().page(number)
+
+        bottom = (number - 1) * self.per_page
+        top = bottom + self.per_page
+        if top + self.orphans >= self.count:
+            top = self.count
+        timestamp, pk = queryset.values_list("timestamp", "pk")[bottom]
+        rows = queryset.filter(
+            Q(timestamp__lt=timestamp) | Q(timestamp=timestamp, pk__lte=pk)
+        )[: top - bottom]
+        return self._get_page(rows, number, self)
+
+
 @admin.register(InventoryLog)
 class InventoryLogAdmin(admin.ModelAdmin):
     """Admin configuration for the InventoryLog model."""
 
+    form = InventoryLogAdminForm
     list_display = [
         "variant",
         "transaction_type",
@@ -295,9 +535,11 @@ class InventoryLogAdmin(admin.ModelAdmin):
     list_filter = [
         "transaction_type",
         "timestamp",
-        "variant__product__category",
-        "created_by",
+        ("variant__product__category", admin.RelatedOnlyFieldListFilter),
+        ("created_by", admin.RelatedOnlyFieldListFilter),
     ]
+    show_full_result_count = False
+    paginator = InventoryLogIndexOffsetPaginator
     search_fields = [
         "variant__product__name",
         "variant__product__brand",
@@ -346,6 +588,16 @@ class InventoryLogAdmin(admin.ModelAdmin):
             )
         )
 
+    def formfield_for_foreignkey(self, db_field, request, **kwargs):
+        """Join the relations each dropdown option's __str__ reads."""
+        if db_field.name == "variant":
+            kwargs["queryset"] = ProductVariant.objects.select_related(
+                "product", "size", "color"
+            )
+        elif db_field.name == "supplier_invoice":
+            kwargs["queryset"] = SupplierInvoice.objects.select_related("supplier")
+        return super().formfield_for_foreignkey(db_field, request, **kwargs)
+
     def has_add_permission(self, request):
         """Prevent manual creation; logs are created via application logic."""
         return False
@@ -372,67 +624,59 @@ admin.site.index_title = "Welcome to Inventory Management"
 # Add custom admin actions and statistics
 def get_inventory_stats():
     """Get inventory statistics for admin dashboard."""
-    from django.db.models import Sum, F
+    from django.db import connection
+    from django.db.models import Count, Sum, F
     from django.utils import timezone
     from datetime import timedelta
 
-    # Basic counts
-    total_products = Product.objects.count()
-    total_variants = ProductVariant.objects.count()
-    total_categories = Category.objects.count()
-    total_colors = Color.objects.count()
-    total_sizes = Size.objects.count()
-
-    # Inventory statistics
-    active_variants = ProductVariant.objects.filter(
-        status=ProductVariant.VariantStatus.ACTIVE
-    ).count()
-    out_of_stock = ProductVariant.objects.filter(
-        quantity=0, status=ProductVariant.VariantStatus.ACTIVE
-    ).count()
-    low_stock = ProductVariant.objects.filter(
-        quantity__lte=F("minimum_quantity"),
-        status=ProductVariant.VariantStatus.ACTIVE,
-    ).count()
-
-    # Financial statistics
-    total_inventory_value = (
-        ProductVariant.objects.aggregate(
-            total=Sum(F("quantity") * F("purchase_price"))
-        )["total"]
-        or 0
-    )
-
-    total_damaged_value = (
-        ProductVariant.objects.aggregate(
-            total=Sum(F("damaged_quantity") * F("purchase_price"))
-        )["total"]
-        or 0
+    # Basic counts - the small reference tables are counted in one round trip
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"SELECT (SELECT COUNT(*) FROM {Category._meta.db_table}), "
+            f"(SELECT COUNT(*) FROM {Color._meta.db_table}), "
+            f"(SELECT COUNT(*) FROM {Size._meta.db_table})"
+        )
+        total_categories, total_colors, total_sizes = cursor.fetchone()
+
+    total_products = Product.objects.aggregate(total=Count("id"))["total"]
+
+    # Inventory and financial statistics in a single scan of the variants
+    active = Q(status=ProductVariant.VariantStatus.ACTIVE)
+    variant_stats = ProductVariant.objects.aggregate(
+        total_variants=Count("id"),
+        active_variants=Count("id", filter=active),
+        out_of_stock=Count("id", filter=active & Q(quantity=0)),
+        low_stock=Count(
+            "id", filter=active & Q(quantity__lte=F("minimum_quantity"))
+        ),
+        total_inventory_value=Sum(F("quantity") * F("purchase_price")),
+        total_damaged_value=Sum(F("damaged_quantity") * F("purchase_price")),
     )
+    total_variants = variant_stats["total_variants"]
+    active_variants = variant_stats["active_variants"]
+    out_of_stock = variant_stats["out_of_stock"]
+    low_stock = variant_stats["low_stock"]
+    total_inventory_value = variant_stats["total_inventory_value"] or 0
+    total_damaged_value = variant_stats["total_damaged_value"] or 0
 
     # Recent activity (last 30 days) - only for active variants
     thirty_days_ago = timezone.now() - timedelta(days=30)
-    recent_transactions = InventoryLog.objects.filter(
-        timestamp__gte=thirty_days_ago, variant__is_deleted=False
-    ).count()
-
-    recent_sales = (
-        InventoryLog.objects.filter(
-            transaction_type=InventoryLog.TransactionTypes.SALE,
-            timestamp__gte=thirty_days_ago,
-            variant__is_deleted=False,
-        ).aggregate(total=Sum("quantity_change"))["total"]
-        or 0
-    )
-
-    recent_stock_in = (
-        InventoryLog.objects.filter(
-            transaction_type=InventoryLog.TransactionTypes.STOCK_IN,
-            timestamp__gte=thirty_days_ago,
-            variant__is_deleted=False,
-        ).aggregate(total=Sum("quantity_change"))["total"]
-        or 0
+    log_stats = InventoryLog.objects.filter(
+        timestamp__gte=thirty_days_ago, variant_is_deleted=False
+    ).aggregate(
+        recent_transactions=Count("id"),
+        recent_sales=Sum(
+            "quantity_change",
+            filter=Q(transaction_type=InventoryLog.TransactionTypes.SALE),
+        ),
+        recent_stock_in=Sum(
+            "quantity_change",
+            filter=Q(transaction_type=InventoryLog.TransactionTypes.STOCK_IN),
+        ),
     )
+    recent_transactions = log_stats["recent_transactions"]
+    recent_sales = log_stats["recent_sales"] or 0
+    recent_stock_in = log_stats["recent_stock_in"] or 0
 
     return {
         "total_products": total_products,
@@ -1,11 +1,17 @@
 """Forms for the Inventory app."""
 
 import logging
+import re
 from decimal import Decimal
 
 from django import forms
+from django.core.cache import cache
+from django.core.exceptions import NON_FIELD_ERRORS
+from django.db.models import Exists, OuterRef
+from django.forms.models import ModelChoiceIterator, ModelFormMetaclass
 
 from .models import (
+    UNIQUE_NAME_ERROR_CODE,
     BulkUpload,
     Category,
     ClothType,
@@ -24,15 +30,272 @@ from supplier.models import Supplier
 
 logger = logging.getLogger(__name__)
 
+# Shared widget attrs; Widget.__init__ copies them, so sharing is safe
+FORM_INPUT_ATTRS = {"class": "form-input"}
+
+HEX_CODE_RE = re.compile(r"#[0-9A-F]{6}")
+HSN_CODE_RE = re.compile(r"[0-9]{4,10}")
+
+# Shared dropdown choices are memoised briefly; inventory/signals.py drops the
+# keys whenever the underlying rows change.
+CHOICES_CACHE_TIMEOUT = 60
+CHOICES_CHUNK_SIZE = 2000
+SUPPLIER_INVOICE_CHOICES_KEY = "supplier_invoices_active_v1"
+RECENT_SUPPLIER_INVOICE_CHOICES_KEY = "supplier_invoices_recent_v1"
+VARIANT_CHOICES_KEY = "variants_active_v1"
+HSN_CHOICES_KEY = "hsn_codes_active_v1"
+HSN_GST_RATES_KEY = "hsn_gst_rates_active_v1"
+UOM_CHOICES_KEY = "uoms_active_v1"
+SUPPLIER_INVOICE_TYPES_KEY = "supplier_invoice_types_active_v1"
+
+
+class CachedModelChoiceIterator(ModelChoiceIterator):
+    """ModelChoiceIterator that reuses cached (pk, label) pairs across forms."""
+
+    def __init__(self, field, cache_key, label_queryset=None):
+        super().__init__(field)
+        self.cache_key = cache_key
+        if label_queryset is not None:
+            self.queryset = label_queryset
+
+    def _cached_choices(self):
+        choices = cache.get(self.cache_key)
+        if choices is None:
+            # Stream the rows; the (pk, label) pairs are all that is kept
+            choices = [
+                (self.field.prepare_value(obj), self.field.label_from_instance(obj))
+                for obj in self.queryset.iterator(chunk_size=CHOICES_CHUNK_SIZE)
+            ]
+            cache.set(self.cache_key, choices, CHOICES_CACHE_TIMEOUT)
+        return choices
+
+    def __iter__(self):
+        if self.field.empty_label is not None:
+            yield ("", self.field.empty_label)
+        yield from self._cached_choices()
+
+    def __len__(self):
+        return len(self._cached_choices()) + (
+            1 if self.field.empty_label is not None else 0
+        )
+
+    def __bool__(self):
+        return self.field.empty_label is not None or bool(self._cached_choices())
+
+
+def cached_choices(field, queryset, cache_key, label_queryset=None):
+    """
+    Validate ``field`` against ``queryset`` but render it from the cache.
+
+    ``label_queryset`` is what a cache miss reads to build the labels; it can
+    be a narrower projection than the validation queryset, whose instances
+    end up in ``cleaned_data``.
+    """
+    field.queryset = queryset
+    field.choices = CachedModelChoiceIterator(field, cache_key, label_queryset)
+
+
+# Columns read by SupplierInvoice.__str__ and ProductVariant.__str__
+SUPPLIER_INVOICE_LABEL_FIELDS = (
+    "invoice_number",
+    "invoice_date",
+    "invoice_type",
+    "total_amount",
+    "supplier__name",
+)
+VARIANT_LABEL_FIELDS = (
+    "barcode",
+    "extra_attributes",
+    "product__brand",
+    "size__name",
+    "color__name",
+)
+
+
+def active_supplier_invoices():
+    """Supplier invoices of active suppliers, joined to the supplier their labels read."""
+    return SupplierInvoice.objects.filter(supplier__is_deleted=False).select_related(
+        "supplier"
+    )
+
+
+def active_supplier_invoice_types():
+    """Cached {pk: invoice_type} for active supplier invoices, for option attrs."""
+    invoice_types = cache.get(SUPPLIER_INVOICE_TYPES_KEY)
+    if invoice_types is None:
+        invoice_types = dict(
+            SupplierInvoice.objects.filter(supplier__is_deleted=False).values_list(
+                "pk", "invoice_type"
+            )
+        )
+        cache.set(SUPPLIER_INVOICE_TYPES_KEY, invoice_types, CHOICES_CACHE_TIMEOUT)
+    return invoice_types
+
+
+def supplier_invoice_labels(queryset):
+    """Narrow ``queryset`` to the joined columns its dropdown labels read."""
+    return queryset.select_related("supplier").only(*SUPPLIER_INVOICE_LABEL_FIELDS)
+
+
+def active_hsn_gst_rates():
+    """Cached {pk: gst percentage} for active HSN codes, for option attrs."""
+    rates = cache.get(HSN_GST_RATES_KEY)
+    if rates is None:
+        rates = {
+            pk: str(gst_percentage)
+            for pk, gst_percentage in GSTHsnCode.objects.filter(
+                is_active=True
+            ).values_list("pk", "gst_percentage")
+        }
+        cache.set(HSN_GST_RATES_KEY, rates, CHOICES_CACHE_TIMEOUT)
+    return rates
+
+
+def active_variants():
+    """Active (not soft-deleted) variants, joined to the rows their names read."""
+    return ProductVariant.objects.filter(is_deleted=False).select_related(
+        "product", "size", "color"
+    )
+
+
+def variant_labels(queryset):
+    """Narrow ``queryset`` to the joined columns its dropdown labels read."""
+    return queryset.select_related("product", "size", "color").only(
+        *VARIANT_LABEL_FIELDS
+    )
+
+
+def positive_cleaner(field_name, message):
+    """Build a ``clean_<field>`` method rejecting values that are not above 0."""
+
+    def clean(self):
+        value = self.cleaned_data.get(field_name)
+        if value is not None and value <= 0:
+            raise forms.ValidationError(message)
+        return value
+
+    clean.__doc__ = f"Validate {field_name} is greater than 0"
+    return clean
+
+
+def non_negative_cleaner(field_name, message):
+    """Build a ``clean_<field>`` method rejecting values below 0."""
+
+    def clean(self):
+        value = self.cleaned_data.get(field_name)
+        if value is not None and value < 0:
+            raise forms.ValidationError(message)
+        return value
+
+    clean.__doc__ = f"Validate {field_name} is non-negative"
+    return clean
+
+
+def range_cleaner(field_name, low, high, message):
+    """Build a ``clean_<field>`` method rejecting values outside [low, high]."""
+
+    def clean(self):
+        value = self.cleaned_data.get(field_name)
+        if value is not None and not low <= value <= high:
+            raise forms.ValidationError(message)
+        return value
+
+    clean.__doc__ = f"Validate {field_name} is between {low} and {high}"
+    return clean
+
+
+class FormInputMeta(ModelFormMetaclass):
+    """Stamp the theme's widget CSS classes onto ``base_fields`` at class creation.
+
+    Django deep-copies ``base_fields`` for every form instance, so each form
+    gets its styling without a per-``__init__`` loop over ``self.fields``.
+    """
+
+    def __new__(mcs, name, bases, attrs):
+        new_class = super().__new__(mcs, name, bases, attrs)
+        for field_name, field in new_class.base_fields.items():
+            widget = field.widget
+            for attr, value in new_class.default_widget_attrs(widget).items():
+                widget.attrs.setdefault(attr, value)
+            if field_name in new_class.widget_classes:
+                widget.attrs["class"] = new_class.widget_classes[field_name]
+        return new_class
+
+
+class ConstraintBackedFieldsMixin:
+    """Leave check-constraint-backed fields to the form's own cleaners.
+
+    Model validation would otherwise run each CheckConstraint on these fields
+    as its own SELECT and report a failure as a non-field error. Forms list
+    here the fields their ``clean_<field>`` methods already check; the
+    constraints stay as the database backstop.
+    """
+
+    constraint_backed_fields = ()
+
+    def _get_validation_exclusions(self):
+        """Add ``constraint_backed_fields`` to the model validation exclusions."""
+        exclude = super()._get_validation_exclusions()
+        exclude.update(self.constraint_backed_fields)
+        return exclude
+
+
+class UniqueNameErrorMixin:
+    """Show case-insensitive unique-name constraint errors beside ``name``.
+
+    Expression-based UniqueConstraints are reported as non-field errors; the
+    master-data constraints tag theirs with ``UNIQUE_NAME_ERROR_CODE``.
+    """
+
+    def _update_errors(self, errors):
+        """Move unique-name violations from the non-field errors onto ``name``."""
+        error_dict = getattr(errors, "error_dict", None)
+        if error_dict and NON_FIELD_ERRORS in error_dict:
+            non_field = error_dict[NON_FIELD_ERRORS]
+            name_errors = [e for e in non_field if e.code == UNIQUE_NAME_ERROR_CODE]
+            if name_errors:
+                error_dict = dict(error_dict)
+                remaining = [e for e in non_field if e.code != UNIQUE_NAME_ERROR_CODE]
+                if remaining:
+                    error_dict[NON_FIELD_ERRORS] = remaining
+                else:
+                    del error_dict[NON_FIELD_ERRORS]
+                error_dict["name"] = error_dict.get("name", []) + name_errors
+                errors = forms.ValidationError(error_dict)
+        super()._update_errors(errors)
+
+
+class FormInputModelForm(
+    ConstraintBackedFieldsMixin, forms.ModelForm, metaclass=FormInputMeta
+):
+    """ModelForm whose widgets carry the theme's CSS classes."""
+
+    input_class = "form-input"
+    checkbox_class = "form-input"
+    # Per-field class overrides, e.g. {"mrp": "form-input indian-number"}
+    widget_classes = {}
+
+    @classmethod
+    def default_widget_attrs(cls, widget):
+        """Attributes set on ``widget`` unless it already declares them."""
+        if isinstance(widget, forms.CheckboxInput):
+            return {"class": cls.checkbox_class} if cls.checkbox_class else {}
+        return {"class": cls.input_class}
+
 
 class GSTHsnCodeSelect(forms.Select):
     """Custom Select widget to inject GST percentage data attributes on options"""
 
+    # Optional {pk: gst percentage} map; options missing from it are looked up
+    gst_rates = None
+
     def create_option(self, name, value, label, selected, index, subindex=None, attrs=None):
         option = super().create_option(name, value, label, selected, index, subindex, attrs)
         if value:
             val_id = value.value if hasattr(value, "value") else value
-            if val_id:
+            if val_id and self.gst_rates and val_id in self.gst_rates:
+                option["attrs"]["data-gst-percentage"] = self.gst_rates[val_id]
+            elif val_id:
                 try:
                     from inventory.models import GSTHsnCode
                     hsn = GSTHsnCode.objects.get(pk=val_id)
@@ -42,7 +305,7 @@ class GSTHsnCodeSelect(forms.Select):
         return option
 
 
-class ProductForm(forms.ModelForm):
+class ProductForm(FormInputModelForm):
     """Form for creating a product"""
 
     class Meta:
@@ -80,81 +343,76 @@ class ProductForm(forms.ModelForm):
             "uom": forms.Select(attrs={"placeholder": "Select UOM"}),
             "hsn_code": GSTHsnCodeSelect(attrs={"placeholder": "Select HSN Code"}),
         }
+        error_messages = {
+            "brand": {
+                "max_length": "Brand name must be less than 255 characters long"
+            },
+            "name": {
+                "max_length": "Product name must be less than 255 characters long"
+            },
+        }
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
-        # Add required field indicators and form-control class
+        # Add required field indicators
         for field in self.fields.values():
             if field.required:
                 field.label = f"{field.label} *"
-            field.widget.attrs["class"] = "form-input"
 
         # Restrict to active querysets
-        self._set_active_queryset("hsn_code", GSTHsnCode)
-        self._set_active_queryset("uom", UOM)
+        self._set_active_queryset("hsn_code", GSTHsnCode, HSN_CHOICES_KEY)
+        self._set_active_queryset("uom", UOM, UOM_CHOICES_KEY)
+        self.fields["hsn_code"].widget.gst_rates = active_hsn_gst_rates()
 
-    def _set_active_queryset(self, field_name, model):
+    def _set_active_queryset(self, field_name, model, cache_key):
         """Helper method to set active queryset for a field"""
-        try:
-            active_qs = model.objects.filter(is_active=True)
-            self.fields[field_name].queryset = active_qs
-
-            if active_qs.exists():
-                if not self.instance.pk:
-                    self.fields[field_name].initial = active_qs.first()
-            else:
-                model_name = model._meta.verbose_name or model.__name__
-                self.fields[field_name].help_text = (
-                    f"Add an active {model_name} before assigning it to a product."
-                )
-        except Exception:  # pylint: disable=broad-except
-            pass
+        active_qs = model.objects.filter(is_active=True)
+        field = self.fields[field_name]
+        cached_choices(field, active_qs, cache_key, active_qs.order_by("pk"))
 
-    def clean_brand(self):
-        """Validate brand name length"""
-        brand = self.cleaned_data.get("brand")
-        if brand and len(brand) > 255:
-            raise forms.ValidationError(
-                "Brand name must be less than 255 characters long"
+        # The cached choices answer both "any active?" and "which first?"
+        choices = field.choices._cached_choices()
+        if choices:
+            if not self.instance.pk:
+                field.initial = choices[0][0]
+        else:
+            self.fields[field_name].help_text = (
+                f"Add an active {model._meta.verbose_name} before assigning it to a product."
             )
-        return brand
 
-    def clean_name(self):
-        """Validate product name length"""
-        name = self.cleaned_data.get("name")
-        if name and len(name) > 255:
-            raise forms.ValidationError(
-                "Product name must be less than 255 characters long"
-            )
-        return name
 
 class SupplierInvoiceSelect(forms.Select):
     """Custom Select widget to inject invoice type data attributes on options"""
 
     def create_option(self, name, value, label, selected, index, subindex=None, attrs=None):
         option = super().create_option(name, value, label, selected, index, subindex, attrs)
-        if value:
-            val_id = value.value if hasattr(value, "value") else value
-            if val_id:
-                try:
-                    from supplier.models import SupplierInvoice
-                    invoice = SupplierInvoice.objects.get(pk=val_id)
-                    option["attrs"]["data-invoice-type"] = invoice.invoice_type
-                except Exception:
-                    pass
+        instance = getattr(value, "instance", None)
+        if instance is not None:
+            option["attrs"]["data-invoice-type"] = instance.invoice_type
+        elif value:
+            # Cached choices carry bare pks; read the type from the shared map
+            if not hasattr(self, "_invoice_types"):
+                self._invoice_types = active_supplier_invoice_types()
+            invoice_type = self._invoice_types.get(value)
+            if invoice_type is not None:
+                option["attrs"]["data-invoice-type"] = invoice_type
         return option
 
 
-class VariantForm(forms.ModelForm):
+class VariantForm(FormInputModelForm):
     """Form for creating a variant"""
 
+    widget_classes = {
+        "purchase_price": "form-input indian-number",
+        "mrp": "form-input indian-number",
+    }
+
+    # Populated per instance in __init__ from the cached recent-invoice choices
     supplier_invoice = forms.ModelChoiceField(
-        queryset=SupplierInvoice.objects.filter(supplier__is_deleted=False).order_by(
-            "-created_at"
-        ),
+        queryset=SupplierInvoice.objects.none(),
         required=False,
-        widget=SupplierInvoiceSelect(attrs={"class": "form-input"}),
+        widget=SupplierInvoiceSelect(),
         help_text="Select the supplier invoice for this variant (optional)",
     )
 
@@ -197,14 +455,18 @@ class VariantForm(forms.ModelForm):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
-        # Add required field indicators and form-control class
+        # Add required field indicators
         for field in self.fields.values():
             if field.required:
                 field.label = f"{field.label} *"
-            field.widget.attrs["class"] = "form-input"
 
-        self.fields["purchase_price"].widget.attrs["class"] = "form-input indian-number"
-        self.fields["mrp"].widget.attrs["class"] = "form-input indian-number"
+        recent_invoices = active_supplier_invoices().order_by("-created_at")
+        cached_choices(
+            self.fields["supplier_invoice"],
+            recent_invoices,
+            RECENT_SUPPLIER_INVOICE_CHOICES_KEY,
+            supplier_invoice_labels(recent_invoices),
+        )
 
         try:
             if not self.instance.pk:
@@ -236,12 +498,6 @@ class VariantForm(forms.ModelForm):
         except Exception as e:  # pylint: disable=broad-except
             logger.error("Failed to set initial values in VariantForm: %s", e)
 
-    def _validate_positive_number(self, value, _field_name, error_message):
-        """Helper method to validate positive numbers"""
-        if value is not None and value <= 0:
-            raise forms.ValidationError(error_message)
-        return value
-
     def clean_quantity(self):
         """Validate quantity is greater than 0, preserving existing quantity if transactions exist"""
         if self.instance and self.instance.pk:
@@ -254,30 +510,21 @@ class VariantForm(forms.ModelForm):
             if has_other_transactions:
                 return self.instance.quantity
 
-        return self._validate_positive_number(
-            self.cleaned_data.get("quantity"),
-            "quantity",
-            "Quantity must be greater than 0",
-        )
+        return self._clean_positive_quantity()
 
-    def clean_purchase_price(self):
-        """Validate purchase price is greater than 0"""
-        return self._validate_positive_number(
-            self.cleaned_data.get("purchase_price"),
-            "purchase_price",
-            "Purchase price must be greater than 0",
-        )
+    _clean_positive_quantity = positive_cleaner(
+        "quantity", "Quantity must be greater than 0"
+    )
 
-    def clean_mrp(self):
-        """Validate selling price (MRP) is greater than 0"""
-        return self._validate_positive_number(
-            self.cleaned_data.get("mrp"),
-            "mrp",
-            "Selling price must be greater than 0",
-        )
+    constraint_backed_fields = ("purchase_price", "mrp")
+
+    clean_purchase_price = positive_cleaner(
+        "purchase_price", "Purchase price must be greater than 0"
+    )
+    clean_mrp = positive_cleaner("mrp", "Selling price must be greater than 0")
 
 
-class CategoryForm(forms.ModelForm):
+class CategoryForm(UniqueNameErrorMixin, FormInputModelForm):
     """Form for creating and editing categories"""
 
     class Meta:
@@ -306,10 +553,6 @@ class CategoryForm(forms.ModelForm):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
-        # Add form-input class to all fields
-        for field in self.fields.values():
-            field.widget.attrs["class"] = "form-input"
-
         # When editing, exclude self and all descendants from parent choices
         # to prevent circular references (e.g. A → B → A)
         if self.instance.pk:
@@ -341,31 +584,8 @@ class CategoryForm(forms.ModelForm):
             name = name.strip()
         return name
 
-    def clean(self):
-        """Ensure category name is unique within the same parent (case-insensitive).
-
-        Allows duplicate names under different parents, e.g.:
-        Women → Inners, Men → Inners, Kids → Inners
-        """
-        cleaned_data = super().clean()
-        name = cleaned_data.get("name")
-        parent = cleaned_data.get("parent")
-
-        if name:
-            # Check for duplicate name under the same parent
-            qs = Category.objects.filter(name__iexact=name, parent=parent)
-            if self.instance.pk:
-                qs = qs.exclude(pk=self.instance.pk)
-
-            if qs.exists():
-                parent_label = f'under "{parent.name}"' if parent else "at root level"
-                raise forms.ValidationError(
-                    f'A category named "{name}" already exists {parent_label}.'
-                )
-        return cleaned_data
-
 
-class ColorForm(forms.ModelForm):
+class ColorForm(UniqueNameErrorMixin, FormInputModelForm):
     """Form for creating and editing colors"""
 
     class Meta:
@@ -389,25 +609,14 @@ class ColorForm(forms.ModelForm):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
-        # Add form-input class to all fields
-        for field in self.fields.values():
-            field.widget.attrs["class"] = "form-input"
-
         # Override maxlength for hex_code to enforce 6 digits
         self.fields["hex_code"].widget.attrs["maxlength"] = "6"
 
     def clean_name(self):
-        """Ensure color name is unique (case-insensitive)"""
+        """Strip whitespace; case-insensitive uniqueness is a model constraint."""
         name = self.cleaned_data.get("name")
         if name:
             name = name.strip()
-            # Check for duplicate (case-insensitive), excluding current instance
-            qs = Color.objects.filter(name__iexact=name)
-            if self.instance.pk:
-                qs = qs.exclude(pk=self.instance.pk)
-
-            if qs.exists():
-                raise forms.ValidationError("A color with this name already exists.")
         return name
 
     def clean_hex_code(self):
@@ -417,16 +626,14 @@ class ColorForm(forms.ModelForm):
             hex_code = hex_code.strip().upper()
             if not hex_code.startswith("#"):
                 hex_code = "#" + hex_code
-            if len(hex_code) != 7 or not all(
-                c in "0123456789ABCDEF" for c in hex_code[1:]
-            ):
+            if not HEX_CODE_RE.fullmatch(hex_code):
                 raise forms.ValidationError(
                     "Please enter a valid hex color code (e.g., #FF0000)"
                 )
         return hex_code
 
 
-class SizeForm(forms.ModelForm):
+class SizeForm(UniqueNameErrorMixin, FormInputModelForm):
     """Form for creating and editing sizes"""
 
     class Meta:
@@ -447,29 +654,15 @@ class SizeForm(forms.ModelForm):
             ),
         }
 
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-
-        # Add form-input class to all fields
-        for field in self.fields.values():
-            field.widget.attrs["class"] = "form-input"
-
     def clean_name(self):
-        """Ensure size name is unique (case-insensitive)"""
+        """Strip whitespace; case-insensitive uniqueness is a model constraint."""
         name = self.cleaned_data.get("name")
         if name:
             name = name.strip()
-            # Check for duplicate (case-insensitive), excluding current instance
-            qs = Size.objects.filter(name__iexact=name)
-            if self.instance.pk:
-                qs = qs.exclude(pk=self.instance.pk)
-
-            if qs.exists():
-                raise forms.ValidationError("A size with this name already exists.")
         return name
 
 
-class ClothTypeForm(forms.ModelForm):
+class ClothTypeForm(UniqueNameErrorMixin, FormInputModelForm):
     """Form for creating and editing cloth types"""
 
     class Meta:
@@ -490,33 +683,19 @@ class ClothTypeForm(forms.ModelForm):
             ),
         }
 
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-
-        # Add form-input class to all fields
-        for field in self.fields.values():
-            field.widget.attrs["class"] = "form-input"
-
     def clean_name(self):
-        """Ensure cloth type name is unique (case-insensitive)"""
+        """Strip whitespace; case-insensitive uniqueness is a model constraint."""
         name = self.cleaned_data.get("name")
         if name:
             name = name.strip()
-            # Check for duplicate (case-insensitive), excluding current instance
-            qs = ClothType.objects.filter(name__iexact=name)
-            if self.instance.pk:
-                qs = qs.exclude(pk=self.instance.pk)
-
-            if qs.exists():
-                raise forms.ValidationError(
-                    "A cloth type with this name already exists."
-                )
         return name
 
 
-class UOMForm(forms.ModelForm):
+class UOMForm(FormInputModelForm):
     """Form for creating and editing UOM (Unit of Measurement)"""
 
+    checkbox_class = "form-check-input"
+
     class Meta:
         model = UOM
         fields = [
@@ -563,44 +742,23 @@ class UOMForm(forms.ModelForm):
             "is_active": forms.CheckboxInput(),
         }
 
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-
-        # Add form-input class to text/number fields, form-check-input to checkboxes
-        for _field_name, field in self.fields.items():
-            widget = field.widget
-            if isinstance(widget, forms.CheckboxInput):
-                widget.attrs["class"] = "form-check-input"
-            else:
-                widget.attrs["class"] = "form-input"
-
     def clean_short_code(self):
-        """Validate and normalize short code, ensure uniqueness"""
+        """Normalize short code; uniqueness is checked by the model field."""
         short_code = self.cleaned_data.get("short_code")
         if short_code:
             short_code = short_code.strip().upper()
-            # Check for duplicate, excluding current instance
-            qs = UOM.objects.filter(short_code=short_code)
-            if self.instance.pk:
-                qs = qs.exclude(pk=self.instance.pk)
-
-            if qs.exists():
-                raise forms.ValidationError(
-                    "A UOM with this short code already exists."
-                )
         return short_code
 
-    def clean_conversion_factor(self):
-        """Validate conversion factor is greater than 0"""
-        conversion_factor = self.cleaned_data.get("conversion_factor")
-        if conversion_factor is not None and conversion_factor <= 0:
-            raise forms.ValidationError("Conversion factor must be greater than 0")
-        return conversion_factor
+    clean_conversion_factor = positive_cleaner(
+        "conversion_factor", "Conversion factor must be greater than 0"
+    )
 
 
-class GSTHsnCodeForm(forms.ModelForm):
+class GSTHsnCodeForm(FormInputModelForm):
     """Form for creating and editing GST HSN Code"""
 
+    checkbox_class = "form-check-input"
+
     class Meta:
         model = GSTHsnCode
         fields = [
@@ -650,55 +808,26 @@ class GSTHsnCodeForm(forms.ModelForm):
             "is_active": forms.CheckboxInput(),
         }
 
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-
-        # Add form-input class to text/number/date fields, form-check-input to checkboxes
-        for _field_name, field in self.fields.items():
-            widget = field.widget
-            if isinstance(widget, forms.CheckboxInput):
-                widget.attrs["class"] = "form-check-input"
-            else:
-                widget.attrs["class"] = "form-input"
-
     def clean_code(self):
-        """Validate HSN code format and ensure uniqueness"""
+        """Validate HSN code format; uniqueness is checked by the model field."""
         code = self.cleaned_data.get("code")
         if code:
             code = code.strip()
-            # Ensure code is numeric
-            if not code.isdigit():
-                raise forms.ValidationError("HSN Code must contain only numbers")
-            # Validate length
-            if len(code) < 4 or len(code) > 10:
+            if not HSN_CODE_RE.fullmatch(code):
+                if not code.isdecimal() or not code.isascii():
+                    raise forms.ValidationError("HSN Code must contain only numbers")
                 raise forms.ValidationError("HSN Code must be 4-10 digits long")
-            # Check for duplicate, excluding current instance
-            qs = GSTHsnCode.objects.filter(code=code)
-            if self.instance.pk:
-                qs = qs.exclude(pk=self.instance.pk)
-
-            if qs.exists():
-                raise forms.ValidationError(
-                    "A GST HSN Code with this code already exists."
-                )
         return code
 
-    def clean_gst_percentage(self):
-        """Validate GST percentage is between 0.00 and 40.00"""
-        gst_percentage = self.cleaned_data.get("gst_percentage")
-        if gst_percentage is not None and (gst_percentage < 0 or gst_percentage > 40):
-            raise forms.ValidationError("GST percentage must be between 0.00 and 40.00")
-        return gst_percentage
-
-    def clean_cess_rate(self):
-        """Validate Cess rate is between 0.00 and 25.00"""
-        cess_rate = self.cleaned_data.get("cess_rate")
-        if cess_rate is not None and (cess_rate < 0 or cess_rate > 25):
-            raise forms.ValidationError("Cess rate must be between 0.00 and 25.00")
-        return cess_rate
+    clean_gst_percentage = range_cleaner(
+        "gst_percentage", 0, 40, "GST percentage must be between 0.00 and 40.00"
+    )
+    clean_cess_rate = range_cleaner(
+        "cess_rate", 0, 25, "Cess rate must be between 0.00 and 25.00"
+    )
 
 
-class StockInForm(forms.ModelForm):
+class StockInForm(FormInputModelForm):
     """Optimized form for stock-in operations."""
 
     class Meta:
@@ -725,22 +854,19 @@ class StockInForm(forms.ModelForm):
             "notes": forms.Textarea(attrs={"rows": 3}),
         }
 
+    @classmethod
+    def default_widget_attrs(cls, widget):
+        """Standardize widget styling using a CSS class (see main.css theming)."""
+        if isinstance(widget, forms.Textarea):
+            return {"class": "form-input multiline"}
+        if isinstance(widget, forms.NumberInput):
+            return {"class": "form-input number", "min": "0"}
+        return dict(FORM_INPUT_ATTRS)
+
     def __init__(self, *args, **kwargs):
         variant = kwargs.pop("variant", None)
         super().__init__(*args, **kwargs)
 
-        # Standardize widget styling using a CSS class (see main.css theming)
-        for _name, field in self.fields.items():
-            if isinstance(field.widget, forms.Textarea):
-                field.widget.attrs.setdefault("class", "form-input multiline")
-            elif isinstance(field.widget, forms.Select):
-                field.widget.attrs.setdefault("class", "form-input")
-            elif isinstance(field.widget, forms.NumberInput):
-                field.widget.attrs.setdefault("class", "form-input number")
-                field.widget.attrs.setdefault("min", "0")
-            else:
-                field.widget.attrs.setdefault("class", "form-input")
-
         self.variant = variant
 
         if self.variant:
@@ -748,36 +874,31 @@ class StockInForm(forms.ModelForm):
             self.fields["variant"].initial = self.variant
             self.fields["variant"].required = False
         else:
-            self.fields["variant"].queryset = ProductVariant.objects.filter(
-                is_deleted=False
+            cached_choices(
+                self.fields["variant"],
+                active_variants(),
+                VARIANT_CHOICES_KEY,
+                variant_labels(active_variants()),
             )
 
-        self.fields["supplier_invoice"].queryset = SupplierInvoice.objects.filter(
-            supplier__is_deleted=False
+        cached_choices(
+            self.fields["supplier_invoice"],
+            active_supplier_invoices(),
+            SUPPLIER_INVOICE_CHOICES_KEY,
+            supplier_invoice_labels(active_supplier_invoices()),
         )
         self.fields["supplier_invoice"].required = False
         self.fields["purchase_price"].required = True
 
-    def clean_quantity_change(self):
-        """Validate quantity change is greater than 0"""
-        quantity_change = self.cleaned_data.get("quantity_change")
-        if quantity_change is not None and quantity_change <= 0:
-            raise forms.ValidationError("Stock in quantity must be greater than zero.")
-        return quantity_change
-
-    def clean_purchase_price(self):
-        """Validate purchase price is non-negative"""
-        purchase_price = self.cleaned_data.get("purchase_price")
-        if purchase_price is not None and purchase_price < 0:
-            raise forms.ValidationError("Purchase price cannot be negative.")
-        return purchase_price
-
-    def clean_mrp(self):
-        """Validate MRP is greater than 0"""
-        mrp = self.cleaned_data.get("mrp")
-        if mrp is not None and mrp <= 0:
-            raise forms.ValidationError("MRP cannot be negative.")
-        return mrp
+    constraint_backed_fields = ("purchase_price",)
+
+    clean_quantity_change = positive_cleaner(
+        "quantity_change", "Stock in quantity must be greater than zero."
+    )
+    clean_purchase_price = non_negative_cleaner(
+        "purchase_price", "Purchase price cannot be negative."
+    )
+    clean_mrp = positive_cleaner("mrp", "MRP cannot be negative.")
 
     def save(self, commit=True):
         instance = super().save(commit=False)
@@ -789,9 +910,45 @@ class StockInForm(forms.ModelForm):
         return instance
 
 
-class InventoryAdjustmentForm(forms.ModelForm):
+# Maps the adjustment form type to the InventoryLog transaction it records
+ADJUSTMENT_TRANSACTION_TYPES = {
+    "adjustment_in": InventoryLog.TransactionTypes.ADJUSTMENT_IN,
+    "adjustment_out": InventoryLog.TransactionTypes.ADJUSTMENT_OUT,
+    "damage": InventoryLog.TransactionTypes.DAMAGE,
+}
+
+# Errors for a non-positive quantity, per adjustment type
+NON_POSITIVE_QUANTITY_MESSAGES = {
+    "adjustment_in": "Adjustment in quantity must be positive.",
+    "adjustment_out": "Adjustment out quantity must be positive.",
+    "damage": "Damage quantity must be positive.",
+}
+# Adjustment types that remove available stock
+STOCK_CHECKED_ADJUSTMENTS = frozenset({"adjustment_out", "damage"})
+
+# Field labels per adjustment type; each form class bakes its own into Meta
+ADJUSTMENT_LABELS = {
+    "adjustment_in": {
+        "quantity_change": "Quantity to Add",
+        "notes": "Reason for Adjustment",
+    },
+    "adjustment_out": {
+        "quantity_change": "Quantity to Remove",
+        "notes": "Reason for Adjustment",
+    },
+    "damage": {
+        "quantity_change": "Quantity to Mark as Damaged",
+        "notes": "Damage Details",
+    },
+}
+
+
+class InventoryAdjustmentForm(FormInputModelForm):
     """Unified form for inventory adjustments (in, out, damage)"""
 
+    adjustment_type = "adjustment_in"
+    transaction_type = InventoryLog.TransactionTypes.ADJUSTMENT_IN
+
     class Meta:
         model = InventoryLog
         fields = [
@@ -801,17 +958,25 @@ class InventoryAdjustmentForm(forms.ModelForm):
             "notes",
         ]
         widgets = {
-            "variant": forms.Select(attrs={"class": "form-input"}),
+            "variant": forms.Select(),
             "quantity_change": forms.NumberInput(
-                attrs={"class": "form-input", "step": "0.01", "autofocus": True}
+                attrs={"step": "0.01", "autofocus": True}
             ),
-            "supplier_invoice": SupplierInvoiceSelect(attrs={"class": "form-input"}),
-            "notes": forms.Textarea(attrs={"class": "form-input", "rows": 3}),
+            "supplier_invoice": SupplierInvoiceSelect(),
+            "notes": forms.Textarea(attrs={"rows": 3}),
         }
+        labels = ADJUSTMENT_LABELS["adjustment_in"]
 
     def __init__(self, *args, **kwargs):
-        self.adjustment_type = kwargs.pop("adjustment_type", "adjustment_in")
+        self.adjustment_type = kwargs.pop("adjustment_type", self.adjustment_type)
+        if self.adjustment_type != type(self).adjustment_type:
+            self.transaction_type = ADJUSTMENT_TRANSACTION_TYPES.get(
+                self.adjustment_type, InventoryLog.TransactionTypes.ADJUSTMENT_IN
+            )
         self.variant = kwargs.pop("variant", None)  # Get variant from kwargs
+        # Optional {invoice_id: variant_ids} map from prefetch_membership()
+        self.invoice_variants = kwargs.pop("invoice_variants", None)
+        show_supplier_invoice = kwargs.pop("show_supplier_invoice", True)
         super().__init__(*args, **kwargs)
 
         # If variant is provided, hide the variant field and set it
@@ -821,61 +986,114 @@ class InventoryAdjustmentForm(forms.ModelForm):
             self.fields["variant"].required = False
         else:
             # Only show variant dropdown if no variant provided
-            self.fields["variant"].queryset = ProductVariant.objects.filter(
-                is_deleted=False
+            cached_choices(
+                self.fields["variant"],
+                active_variants(),
+                VARIANT_CHOICES_KEY,
+                variant_labels(active_variants()),
             )
 
-        # Filter supplier invoices based on variant and operation type
-        if self.variant:
+        if not show_supplier_invoice:
+            # Callers that ignore the invoice skip building its dropdown
+            del self.fields["supplier_invoice"]
+        elif self.variant and self.adjustment_type == "damage":
             # For damage operations, only show supplier invoices that supplied stock (INITIAL or STOCK_IN) for this variant
-            if self.adjustment_type == "damage":
-                from inventory.models import InventoryLog
-                self.fields["supplier_invoice"].queryset = (
-                    SupplierInvoice.objects.filter(
-                        supplier__is_deleted=False,
-                        inventory_logs__variant=self.variant,
-                        inventory_logs__transaction_type__in=[
-                            InventoryLog.TransactionTypes.INITIAL,
-                            InventoryLog.TransactionTypes.STOCK_IN,
-                        ],
-                    ).distinct()
-                )
-            else:
-                # For other operations, show all active supplier invoices
-                self.fields["supplier_invoice"].queryset = (
-                    SupplierInvoice.objects.filter(supplier__is_deleted=False)
-                )
+            # Semi-join instead of JOIN + DISTINCT over every matching log
+            supplied_variant = InventoryLog.all_objects.filter(
+                supplier_invoice=OuterRef("pk"),
+                variant=self.variant,
+                transaction_type__in=[
+                    InventoryLog.TransactionTypes.INITIAL,
+                    InventoryLog.TransactionTypes.STOCK_IN,
+                ],
+            )
+            self.fields["supplier_invoice"].queryset = active_supplier_invoices().filter(
+                Exists(supplied_variant)
+            )
         else:
-            # If no variant provided, show all active supplier invoices
-            self.fields["supplier_invoice"].queryset = SupplierInvoice.objects.filter(
-                supplier__is_deleted=False
+            # Otherwise show all active supplier invoices
+            cached_choices(
+                self.fields["supplier_invoice"],
+                active_supplier_invoices(),
+                SUPPLIER_INVOICE_CHOICES_KEY,
+                supplier_invoice_labels(active_supplier_invoices()),
             )
 
         # Make supplier_invoice optional
-        self.fields["supplier_invoice"].required = False
-
-        # Set labels based on adjustment type
-        labels = {
-            "adjustment_in": {
-                "quantity_change": "Quantity to Add",
-                "notes": "Reason for Adjustment",
-            },
-            "adjustment_out": {
-                "quantity_change": "Quantity to Remove",
-                "notes": "Reason for Adjustment",
-            },
-            "damage": {
-                "quantity_change": "Quantity to Mark as Damaged",
-                "notes": "Damage Details",
-            },
-        }
-
-        # Apply appropriate labels
-        if self.adjustment_type in labels:
-            for field_name, label in labels[self.adjustment_type].items():
+        if "supplier_invoice" in self.fields:
+            self.fields["supplier_invoice"].required = False
+
+        # Class labels come from Meta; only an overridden type needs relabelling
+        if self.adjustment_type != type(self).adjustment_type:
+            for field_name, label in ADJUSTMENT_LABELS.get(
+                self.adjustment_type, {}
+            ).items():
                 if field_name in self.fields:
                     self.fields[field_name].label = label
 
+    @staticmethod
+    def _membership_logs(adjustment_type):
+        """Logs that tie a variant to a supplier invoice for this adjustment."""
+        logs = InventoryLog.objects.all()
+        if adjustment_type == "damage":
+            # Damage can only be attributed to invoices that supplied stock
+            logs = logs.filter(
+                transaction_type__in=[
+                    InventoryLog.TransactionTypes.INITIAL,
+                    InventoryLog.TransactionTypes.STOCK_IN,
+                ]
+            )
+        return logs
+
+    @classmethod
+    def prefetch_membership(cls, invoices, adjustment_type=None):
+        """Map supplier invoice ids to the variant ids valid for them.
+
+        Views validating several adjustment forms can build this once and
+        pass it as ``invoice_variants`` so ``clean()`` skips its per-form query.
+        ``invoices`` may hold SupplierInvoice instances or primary keys.
+        """
+        membership = {getattr(invoice, "pk", invoice): set() for invoice in invoices}
+        rows = cls._membership_logs(
+            adjustment_type or cls.adjustment_type
+        ).filter(supplier_invoice__in=list(membership)).values_list(
+            "supplier_invoice_id", "variant_id"
+        )
+        for invoice_id, variant_id in rows:
+            membership[invoice_id].add(variant_id)
+        return {pk: frozenset(ids) for pk, ids in membership.items()}
+
+    @classmethod
+    def bulk_clean(cls, forms_list):
+        """Validate bound adjustment forms with one membership query per type.
+
+        Returns True when every form is valid.
+        """
+        invoice_ids = {}
+        for form in forms_list:
+            if "supplier_invoice" not in form.fields:
+                continue
+            value = str(form["supplier_invoice"].value() or "")
+            if value.isdigit():
+                invoice_ids.setdefault(form.adjustment_type, set()).add(int(value))
+        membership = {
+            adjustment_type: cls.prefetch_membership(ids, adjustment_type)
+            for adjustment_type, ids in invoice_ids.items()
+        }
+        for form in forms_list:
+            if form.adjustment_type in membership and form.invoice_variants is None:
+                form.invoice_variants = membership[form.adjustment_type]
+        return all([form.is_valid() for form in forms_list])
+
+    def _invoice_has_variant(self, supplier_invoice, variant):
+        if self.invoice_variants and supplier_invoice.pk in self.invoice_variants:
+            return variant.pk in self.invoice_variants[supplier_invoice.pk]
+        return (
+            self._membership_logs(self.adjustment_type)
+            .filter(supplier_invoice=supplier_invoice, variant=variant)
+            .exists()
+        )
+
     def clean(self):
         cleaned_data = super().clean()
         quantity_change = cleaned_data.get("quantity_change")
@@ -890,47 +1108,39 @@ class InventoryAdjustmentForm(forms.ModelForm):
 
         # Validate supplier invoice contains this variant (if supplier invoice is selected)
         if supplier_invoice and variant:
-            from inventory.models import InventoryLog
+            has_variant = self._invoice_has_variant(supplier_invoice, variant)
             if self.adjustment_type == "damage":
-                has_supplied_stock = supplier_invoice.inventory_logs.filter(
-                    variant=variant,
-                    transaction_type__in=[
-                        InventoryLog.TransactionTypes.INITIAL,
-                        InventoryLog.TransactionTypes.STOCK_IN,
-                    ],
-                ).exists()
-                if not has_supplied_stock:
+                if not has_variant:
                     raise forms.ValidationError(
                         f"The selected supplier invoice does not have stock supplied for the variant '{variant.full_name}'. "
                         "Please select a supplier invoice that supplied stock for this variant."
                     )
-            elif not supplier_invoice.inventory_logs.filter(variant=variant).exists():
+            elif not has_variant:
                 raise forms.ValidationError(
                     f"The selected supplier invoice does not contain the variant '{variant.full_name}'. "
                     "Please select a supplier invoice that contains this variant."
                 )
 
         # Validate quantity based on adjustment type
-        if quantity_change is not None:
-            if quantity_change <= 0:
-                error_messages = {
-                    "adjustment_in": "Adjustment in quantity must be positive.",
-                    "adjustment_out": "Adjustment out quantity must be positive.",
-                    "damage": "Damage quantity must be positive.",
-                }
-                raise forms.ValidationError(
-                    error_messages.get(
-                        self.adjustment_type, "Quantity must be positive."
-                    )
+        if quantity_change is None:
+            return cleaned_data
+
+        if quantity_change <= 0:
+            raise forms.ValidationError(
+                NON_POSITIVE_QUANTITY_MESSAGES.get(
+                    self.adjustment_type, "Quantity must be positive."
                 )
+            )
 
-            # For adjustment_out and damage, check if sufficient stock exists
-            if self.adjustment_type in ["adjustment_out", "damage"]:
-                if variant.quantity < quantity_change:
-                    raise forms.ValidationError(
-                        f"Insufficient stock. Available: {variant.quantity}, "
-                        f"Requested: {quantity_change}"
-                    )
+        # For adjustment_out and damage, check if sufficient stock exists
+        if (
+            self.adjustment_type in STOCK_CHECKED_ADJUSTMENTS
+            and variant.quantity < quantity_change
+        ):
+            raise forms.ValidationError(
+                f"Insufficient stock. Available: {variant.quantity}, "
+                f"Requested: {quantity_change}"
+            )
 
         return cleaned_data
 
@@ -942,16 +1152,7 @@ class InventoryAdjustmentForm(forms.ModelForm):
         if self.variant and not instance.variant:
             instance.variant = self.variant
 
-        # Map adjustment_type to transaction_type
-        transaction_type_mapping = {
-            "adjustment_in": InventoryLog.TransactionTypes.ADJUSTMENT_IN,
-            "adjustment_out": InventoryLog.TransactionTypes.ADJUSTMENT_OUT,
-            "damage": InventoryLog.TransactionTypes.DAMAGE,
-        }
-
-        instance.transaction_type = transaction_type_mapping.get(
-            self.adjustment_type, InventoryLog.TransactionTypes.ADJUSTMENT_IN
-        )
+        instance.transaction_type = self.transaction_type
 
         if commit:
             instance.save()
@@ -962,25 +1163,70 @@ class InventoryAdjustmentForm(forms.ModelForm):
 class AdjustmentInForm(InventoryAdjustmentForm):
     """Form for adjustment in operations"""
 
-    def __init__(self, *args, **kwargs):
-        kwargs["adjustment_type"] = "adjustment_in"
-        super().__init__(*args, **kwargs)
+    adjustment_type = "adjustment_in"
+
+    class Meta(InventoryAdjustmentForm.Meta):
+        labels = ADJUSTMENT_LABELS["adjustment_in"]
 
 
 class AdjustmentOutForm(InventoryAdjustmentForm):
     """Form for adjustment out operations"""
 
-    def __init__(self, *args, **kwargs):
-        kwargs["adjustment_type"] = "adjustment_out"
-        super().__init__(*args, **kwargs)
+    adjustment_type = "adjustment_out"
+    transaction_type = InventoryLog.TransactionTypes.ADJUSTMENT_OUT
+
+    class Meta(InventoryAdjustmentForm.Meta):
+        labels = ADJUSTMENT_LABELS["adjustment_out"]
 
 
 class DamageForm(InventoryAdjustmentForm):
     """Form for damage operations"""
 
-    def __init__(self, *args, **kwargs):
-        kwargs["adjustment_type"] = "damage"
+    adjustment_type = "damage"
+    transaction_type = InventoryLog.TransactionTypes.DAMAGE
+
+    class Meta(InventoryAdjustmentForm.Meta):
+        labels = ADJUSTMENT_LABELS["damage"]
+
+
+class BulkQuantityAdjustmentForm(forms.Form):
+    """Per-variant signed quantity deltas for the admin bulk adjustment action."""
+
+    notes = forms.CharField(
+        widget=forms.Textarea(attrs={"rows": 3}),
+        required=False,
+        label="Reason for Adjustment",
+    )
+
+    def __init__(self, *args, variants=(), **kwargs):
         super().__init__(*args, **kwargs)
+        self.variants = list(variants)
+        for variant in self.variants:
+            self.fields[self._field_name(variant)] = forms.DecimalField(
+                max_digits=10,
+                decimal_places=2,
+                required=False,
+                initial=Decimal("0"),
+                label=str(variant),
+            )
+
+    @staticmethod
+    def _field_name(variant):
+        return f"delta_{variant.pk}"
+
+    @property
+    def rows(self):
+        """Yield (variant, bound delta field) pairs for rendering."""
+        for variant in self.variants:
+            yield variant, self[self._field_name(variant)]
+
+    def get_deltas(self):
+        """Return {variant_pk: Decimal change} for the submitted rows."""
+        return {
+            variant.pk: self.cleaned_data.get(self._field_name(variant))
+            or Decimal("0")
+            for variant in self.variants
+        }
 
 
 class DamageResolveForm(forms.Form):
@@ -1003,18 +1249,20 @@ class DamageResolveForm(forms.Form):
         choices=RESOLUTION_CHOICES,
         required=True,
         label="Resolution Type",
-        widget=forms.Select(attrs={"class": "form-input", "id": "id_resolution_type"}),
+        widget=forms.Select(attrs={**FORM_INPUT_ATTRS, "id": "id_resolution_type"}),
     )
     supplier = forms.ModelChoiceField(
         queryset=Supplier.objects.filter(is_deleted=False),
         required=False,
         label="Supplier",
+        widget=forms.Select(attrs=FORM_INPUT_ATTRS),
     )
     supplier_invoice = forms.ModelChoiceField(
         queryset=SupplierInvoice.objects.none(),
         required=False,
         label="Supplier Invoice",
         help_text="Optional: link to the original purchase invoice",
+        widget=forms.Select(attrs=FORM_INPUT_ATTRS),
     )
     repair_cost = forms.DecimalField(
         min_value=Decimal("0"),
@@ -1024,9 +1272,10 @@ class DamageResolveForm(forms.Form):
         initial=0,
         label="Repair Cost",
         help_text="Optional: total cost of repair",
+        widget=forms.NumberInput(attrs=FORM_INPUT_ATTRS),
     )
     notes = forms.CharField(
-        widget=forms.Textarea(attrs={"rows": 3, "class": "form-input"}),
+        widget=forms.Textarea(attrs={**FORM_INPUT_ATTRS, "rows": 3}),
         required=False,
         label="Resolution Notes",
     )
@@ -1035,11 +1284,6 @@ class DamageResolveForm(forms.Form):
         self.damage_record = record
         super().__init__(*args, **kwargs)
 
-        # Style widgets
-        self.fields["supplier"].widget.attrs["class"] = "form-input"
-        self.fields["supplier_invoice"].widget.attrs["class"] = "form-input"
-        self.fields["repair_cost"].widget.attrs["class"] = "form-input"
-
         if record and record.variant:
             variant = record.variant
             from inventory.models import InventoryLog
@@ -1148,9 +1392,11 @@ class DamageResolveForm(forms.Form):
         return cleaned_data
 
 
-class VariantMediaForm(forms.ModelForm):
+class VariantMediaForm(FormInputModelForm):
     """Form for uploading media (images/videos) to a product variant."""
 
+    checkbox_class = None
+
     ALLOWED_IMAGE_EXTENSIONS = ["jpg", "jpeg", "png", "webp", "gif"]
     ALLOWED_VIDEO_EXTENSIONS = ["mp4", "webm", "mov"]
     MAX_IMAGE_SIZE = 50 * 1024 * 1024  # 50 MB — originals kept, thumbnails generated
@@ -1171,12 +1417,6 @@ class VariantMediaForm(forms.ModelForm):
             "is_featured": forms.CheckboxInput(),
         }
 
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        for field in self.fields.values():
-            if not isinstance(field.widget, forms.CheckboxInput):
-                field.widget.attrs["class"] = "form-input"
-
     def clean_file(self):
         """Validate file extension and size."""
         uploaded_file = self.cleaned_data.get("file")
@@ -1210,9 +1450,11 @@ class VariantMediaForm(forms.ModelForm):
         return uploaded_file
 
 
-class InventoryPriceUpdateForm(forms.ModelForm):
+class InventoryPriceUpdateForm(FormInputModelForm):
     """Minimal form for updating only MRP and discount percentage on a variant."""
 
+    widget_classes = {"mrp": "form-input indian-number"}
+
     class Meta:
         model = ProductVariant
         fields = ["mrp", "discount_percentage"]
@@ -1233,21 +1475,44 @@ class InventoryPriceUpdateForm(forms.ModelForm):
             ),
         }
 
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        for field in self.fields.values():
-            field.widget.attrs["class"] = "form-input"
-        self.fields["mrp"].widget.attrs["class"] = "form-input indian-number"
+    constraint_backed_fields = ("mrp",)
+
+    clean_mrp = positive_cleaner("mrp", "Selling price must be greater than 0")
+
+
+class ProductVariantAdminForm(ConstraintBackedFieldsMixin, forms.ModelForm):
+    """Admin change form checking the constraint-backed columns on their fields."""
 
-    def clean_mrp(self):
-        """Validate selling price (MRP) is greater than 0."""
-        mrp = self.cleaned_data.get("mrp")
-        if mrp is not None and mrp <= 0:
-            raise forms.ValidationError("Selling price must be greater than 0")
-        return mrp
+    constraint_backed_fields = ("purchase_price", "mrp", "damaged_quantity")
 
+    class Meta:
+        model = ProductVariant
+        fields = "__all__"
+
+    clean_purchase_price = non_negative_cleaner(
+        "purchase_price", "Purchase price cannot be negative."
+    )
+    clean_mrp = non_negative_cleaner("mrp", "Selling price cannot be negative.")
+    clean_damaged_quantity = non_negative_cleaner(
+        "damaged_quantity", "Damaged quantity cannot be negative."
+    )
+
+
+class InventoryLogAdminForm(ConstraintBackedFieldsMixin, forms.ModelForm):
+    """Admin change form checking the log purchase price on its field."""
+
+    constraint_backed_fields = ("purchase_price",)
 
-class BulkUploadForm(forms.ModelForm):
+    class Meta:
+        model = InventoryLog
+        fields = "__all__"
+
+    clean_purchase_price = non_negative_cleaner(
+        "purchase_price", "Purchase price cannot be negative."
+    )
+
+
+class BulkUploadForm(FormInputModelForm):
     """Form for creating and editing BulkUpload batches."""
 
     class Meta:
@@ -1262,9 +1527,11 @@ class BulkUploadForm(forms.ModelForm):
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        for field in self.fields.values():
-            field.widget.attrs["class"] = "form-input"
 
-        self.fields["supplier_invoice"].queryset = SupplierInvoice.objects.filter(
-            supplier__is_deleted=False
-        ).order_by("-created_at")
+        recent_invoices = active_supplier_invoices().order_by("-created_at")
+        cached_choices(
+            self.fields["supplier_invoice"],
+            recent_invoices,
+            RECENT_SUPPLIER_INVOICE_CHOICES_KEY,
+            supplier_invoice_labels(recent_invoices),
+        )
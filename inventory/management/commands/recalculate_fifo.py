@@ -12,6 +12,7 @@ Usage:
     python manage.py recalculate_fifo --dry-run
     python manage.py recalculate_fifo --execute
     python manage.py recalculate_fifo --execute --variant-id 42
+    python manage.py recalculate_fifo --execute --batch-size 1000
 """
 
 import logging
@@ -69,11 +70,18 @@ class Command(BaseCommand):
             default=None,
             help="Process only a specific variant ID (for debugging)",
         )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=500,
+            help="Number of logs written per bulk database batch (default: 500)",
+        )
 
     def handle(self, *args, **options):
         dry_run = options["dry_run"]
         execute = options["execute"]
         variant_id = options["variant_id"]
+        batch_size = options["batch_size"]
 
         if not dry_run and not execute:
             self.stdout.write(
@@ -125,11 +133,22 @@ class Command(BaseCommand):
         report_entries = []
         errors = []
 
-        for variant in variants.select_related("product").iterator(chunk_size=100):
+        # Replay only needs stock plus the columns str(variant) reads
+        variants = variants.select_related("product", "size", "color").only(
+            "id",
+            "quantity",
+            "barcode",
+            "extra_attributes",
+            "product__brand",
+            "size__name",
+            "color__name",
+        )
+
+        for variant in variants.iterator(chunk_size=100):
             stats["variants_processed"] += 1
 
             try:
-                result = self._process_variant(variant, dry_run)
+                result = self._process_variant(variant, dry_run, batch_size)
 
                 if result["was_fixed"]:
                     stats["variants_fixed"] += 1
@@ -160,7 +179,7 @@ class Command(BaseCommand):
         # Print summary
         self._print_summary(stats, dry_run)
 
-    def _process_variant(self, variant, dry_run):
+    def _process_variant(self, variant, dry_run, batch_size=500):
         """
         Process a single variant: replay all logs chronologically and fix FIFO links.
 
@@ -465,12 +484,14 @@ class Command(BaseCommand):
                             "purchase_price",
                             "total_value",
                         ],
-                        batch_size=500,
+                        batch_size=batch_size,
                     )
 
                 # Create new split logs (multi-batch FIFO)
                 if new_logs_to_create:
-                    InventoryLog.objects.bulk_create(new_logs_to_create, batch_size=500)
+                    InventoryLog.objects.bulk_create(
+                        new_logs_to_create, batch_size=batch_size
+                    )
 
                 # Update variant quantity
                 if result["quantity_mismatch"]:
@@ -111,7 +111,9 @@ class Command(BaseCommand):
             if not batch_items or not execute:
                 return
             try:
-                result = self._batch_link_supplier_invoices(batch_items)
+                result = self._batch_link_supplier_invoices(
+                    batch_items, batch_size
+                )
                 auto_linked_count += result.get("parent_logs_linked", 0)
             except Exception as e:
                 skipped_count += len(batch_items)
@@ -258,7 +260,7 @@ class Command(BaseCommand):
         corrected_count = 0
         logs_to_update = []
 
-        for stock_log in stock_logs:
+        for stock_log in stock_logs.stream():
             # For INITIAL log, if present quantity >= 0, ensure initial quantity_change reflects present stock + net stock movements
             if (
                 stock_log.transaction_type == InventoryLog.TransactionTypes.INITIAL
@@ -319,7 +321,9 @@ class Command(BaseCommand):
 
         if execute and logs_to_update:
             InventoryLog.objects.bulk_update(
-                logs_to_update, ["quantity_change", "remaining_quantity", "total_value"]
+                logs_to_update,
+                ["quantity_change", "remaining_quantity", "total_value"],
+                batch_size=batch_size,
             )
 
         # -------------------------------------------------------------
@@ -341,7 +345,7 @@ class Command(BaseCommand):
         else:
             self.stdout.write(self.style.SUCCESS("[OK] All repairs & reconciliations applied to database"))
 
-    def _batch_link_supplier_invoices(self, link_items):
+    def _batch_link_supplier_invoices(self, link_items, batch_size=500):
         """Perform bulk supplier invoice linking and propagation across a batch of logs."""
         if not link_items:
             return {"parent_logs_linked": 0, "child_logs_updated": 0}
@@ -368,7 +372,7 @@ class Command(BaseCommand):
             InventoryLog.objects.bulk_update(
                 parent_logs_to_update,
                 ["supplier_invoice", "notes"],
-                batch_size=500,
+                batch_size=batch_size,
             )
 
             # 2. Bulk update child logs assigned to these parent logs
@@ -386,7 +390,7 @@ class Command(BaseCommand):
                 InventoryLog.objects.bulk_update(
                     child_logs_to_update,
                     ["supplier_invoice"],
-                    batch_size=500,
+                    batch_size=batch_size,
                 )
 
             # 3. Update DamagedItemRecords for affected variants where supplier_invoice is null
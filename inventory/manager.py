@@ -1,74 +1,177 @@
 """Custom model managers for the Inventory app."""
 
+from django.conf import settings
 from django.db import models
-from django.db.models import Sum, Case, When, F, Value, DecimalField
+from django.db.models import Q, Sum, Value, DecimalField
 from django.db.models.functions import Coalesce
 
 from base.manager import SoftDeleteManager
 
 
-class ProductVariantManager(SoftDeleteManager):
+# Filters behind the zero-argument ProductVariantManager helpers
+ACTIVE_Q = Q(status="ACTIVE")
+LOW_STOCK_Q = Q(quantity__lte=models.F("minimum_quantity")) & ACTIVE_Q
+OUT_OF_STOCK_Q = Q(quantity=0) & ACTIVE_Q
+IN_STOCK_Q = Q(quantity__gt=0) & ACTIVE_Q
+WITH_DAMAGE_Q = Q(damaged_quantity__gt=0)
+WITH_DISCOUNT_Q = Q(discount_percentage__gt=0) & ACTIVE_Q
+
+# Lookups ProductVariantManager.by_attrs() accepts as keyword arguments
+VARIANT_ATTR_FILTERS = frozenset(
+    {"size", "color", "status", "product", "product__category"}
+)
+
+# Transaction-type buckets and output type for InventoryLog stock summaries
+SUMMARY_QUANTITY_FIELD = DecimalField(max_digits=16, decimal_places=3)
+STOCK_IN_SUMMARY_TYPES = ("STOCK_IN", "INITIAL", "ADJUSTMENT_IN")
+SALES_SUMMARY_TYPES = ("SALE", "RETURN", "CANCEL")
+DAMAGE_SUMMARY_TYPES = ("DAMAGE", "ADJUSTMENT_OUT")
+
+
+def _summary_sum(transaction_types):
+    """Zero-defaulted sum of quantity_change over the given transaction types."""
+    return Coalesce(
+        Sum(
+            "quantity_change",
+            filter=Q(transaction_type__in=transaction_types),
+            output_field=SUMMARY_QUANTITY_FIELD,
+        ),
+        Value(0),
+        output_field=SUMMARY_QUANTITY_FIELD,
+    )
+
+
+# Built once; annotate() copies expressions as it resolves them
+STOCK_SUMMARY_ANNOTATIONS = {
+    "stock_in_quantity": _summary_sum(STOCK_IN_SUMMARY_TYPES),
+    "sales_quantity": _summary_sum(SALES_SUMMARY_TYPES),
+    "damage_quantity": _summary_sum(DAMAGE_SUMMARY_TYPES),
+}
+
+# Columns a variant listing row reads to render full_name and stock levels
+SLIM_VARIANT_FIELDS = (
+    "id",
+    "barcode",
+    "quantity",
+    "minimum_quantity",
+    "mrp",
+    "status",
+    "created_at",
+    "product__brand",
+    "product__name",
+    "size__name",
+    "color__name",
+)
+
+
+class ProductVariantQuerySet(models.QuerySet):
+    """Custom queryset helpers for ProductVariant listings."""
+
+    def slim(self):
+        """Load only the columns listed in SLIM_VARIANT_FIELDS, joined in one query."""
+        return self.select_related("product", "size", "color").only(
+            *SLIM_VARIANT_FIELDS
+        )
+
+    def with_related(self):
+        """Join the product (with category and HSN code), size and colour rows."""
+        return self.select_related(
+            "product",
+            "product__category",
+            "product__cloth_type",
+            "product__hsn_code",
+            "size",
+            "color",
+        )
+
+
+class ProductVariantManager(SoftDeleteManager.from_queryset(ProductVariantQuerySet)):
     """Custom manager for ProductVariant with common queries"""
 
     def active(self):
         """Get only active variants"""
-        return self.filter(status="ACTIVE")
+        return self.filter(ACTIVE_Q)
 
     def low_stock(self):
         """Get variants with low stock (at or below minimum quantity)"""
-        return self.filter(
-            quantity__lte=models.F("minimum_quantity"),
-            status="ACTIVE",
-        )
+        return self.filter(LOW_STOCK_Q)
 
     def out_of_stock(self):
         """Get variants that are out of stock"""
-        return self.filter(quantity=0, status="ACTIVE")
+        return self.filter(OUT_OF_STOCK_Q)
 
     def with_damage(self):
         """Get variants with damaged items"""
-        return self.filter(damaged_quantity__gt=0)
+        return self.filter(WITH_DAMAGE_Q)
 
     def by_category(self, category):
         """Get variants by product category"""
-        return self.filter(product__category=category)
+        return self.filter(product__category=category).with_related()
 
     def by_brand(self, brand):
         """Get variants by product brand"""
-        return self.filter(product__brand__icontains=brand)
+        return self.filter(product__brand__icontains=brand).with_related()
 
     def by_status(self, status):
         """Get variants by status"""
-        return self.filter(status=status)
+        return self.by_attrs(status=status)
+
+    def by_attrs(self, **attrs):
+        """
+        Get variants matching every given attribute in a single filter().
+
+        Only keys in VARIANT_ATTR_FILTERS are accepted; status defaults to
+        ACTIVE unless passed explicitly.
+        """
+        unknown = set(attrs) - VARIANT_ATTR_FILTERS
+        if unknown:
+            raise ValueError(
+                f"Unsupported variant filter(s): {', '.join(sorted(unknown))}"
+            )
+        attrs.setdefault("status", "ACTIVE")
+        return self.filter(**attrs)
 
     def in_stock(self):
         """Get variants that are in stock"""
-        return self.filter(quantity__gt=0, status="ACTIVE")
+        return self.filter(IN_STOCK_Q)
 
     def by_price_range(self, min_price=None, max_price=None):
         """Get variants within a price range"""
-        queryset = self.filter(status="ACTIVE")
+        condition = ACTIVE_Q
         if min_price is not None:
-            queryset = queryset.filter(mrp__gte=min_price)
+            condition &= Q(mrp__gte=min_price)
         if max_price is not None:
-            queryset = queryset.filter(mrp__lte=max_price)
-        return queryset
+            condition &= Q(mrp__lte=max_price)
+        return self.filter(condition)
 
     def with_discount(self):
         """Get variants that have discounts applied"""
-        return self.filter(discount_percentage__gt=0, status="ACTIVE")
+        return self.filter(WITH_DISCOUNT_Q)
 
     def by_product(self, product):
         """Get variants by specific product"""
-        return self.filter(product=product, status="ACTIVE")
+        return self.filter(product=product, status="ACTIVE").with_related()
 
     def by_size(self, size):
         """Get variants by size"""
-        return self.filter(size=size, status="ACTIVE")
+        return self.by_attrs(size=size)
 
     def by_color(self, color):
         """Get variants by color"""
-        return self.filter(color=color, status="ACTIVE")
+        return self.by_attrs(color=color)
+
+
+class FavoriteVariantManager(models.Manager):
+    """Manager that joins the user and variant rows FavoriteVariant.__str__ reads."""
+
+    def get_queryset(self):
+        return (
+            super()
+            .get_queryset()
+            .select_related(
+                "user", "variant__product", "variant__size", "variant__color"
+            )
+        )
 
 
 class InventoryLogQuerySet(models.QuerySet):
@@ -79,58 +182,44 @@ class InventoryLogQuerySet(models.QuerySet):
         Annotate the queryset with stock in/sales/damage totals so callers
         can simply chain `.with_stock_summary()` after filters/values().
         """
+        return self.annotate(**STOCK_SUMMARY_ANNOTATIONS)
+
+    def stream(self, chunk_size=2000):
+        """
+        Iterate the queryset in `chunk_size` batches (a server-side cursor on
+        PostgreSQL) so long log scans keep a bounded row buffer.
+        """
+        return self.iterator(chunk_size=chunk_size)
 
-        quantity_field = DecimalField(max_digits=16, decimal_places=3)
-
-        return self.annotate(
-            stock_in_quantity=Coalesce(
-                Sum(
-                    Case(
-                        When(
-                            transaction_type__in=[
-                                "STOCK_IN",
-                                "INITIAL",
-                                "ADJUSTMENT_IN",
-                            ],
-                            then=F("quantity_change"),
-                        ),
-                        default=Value(0),
-                        output_field=quantity_field,
-                    )
-                ),
-                Value(0),
-                output_field=quantity_field,
-            ),
-            sales_quantity=Coalesce(
-                Sum(
-                    Case(
-                        When(
-                            transaction_type__in=["SALE", "RETURN", "CANCEL"],
-                            then=F("quantity_change"),
-                        ),
-                        default=Value(0),
-                        output_field=quantity_field,
-                    )
-                ),
-                Value(0),
-                output_field=quantity_field,
-            ),
-            damage_quantity=Coalesce(
-                Sum(
-                    Case(
-                        When(
-                            transaction_type__in=["DAMAGE", "ADJUSTMENT_OUT"],
-                            then=F("quantity_change"),
-                        ),
-                        default=Value(0),
-                        output_field=quantity_field,
-                    )
-                ),
-                Value(0),
-                output_field=quantity_field,
-            ),
+    def stock_summary_by_variant(self, variant_ids):
+        """
+        One `with_stock_summary()` row per variant in `variant_ids`, computed in
+        a single grouped query instead of one aggregation per variant.
+        """
+        return (
+            self.filter(variant_id__in=variant_ids)
+            .values("variant_id")
+            .order_by()
+            .with_stock_summary()
         )
 
 
 class InventoryLogManager(SoftDeleteManager.from_queryset(InventoryLogQuerySet)):
     """Manager that keeps soft-delete filtering while exposing queryset helpers."""
+
+    def log_bulk(self, entries, batch_size=None):
+        """
+        Insert unsaved InventoryLog entries with bulk_create(), batched by
+        `batch_size` or settings.INVENTORY_LOG_BULK_BATCH_SIZE.
+
+        bulk_create() skips InventoryLog.save(), so variant_is_deleted is
+        copied here from each entry's already-loaded variant.
+        """
+        variant_field = self.model.variant
+        for entry in entries:
+            if variant_field.is_cached(entry):
+                entry.variant_is_deleted = entry.variant.is_deleted
+        return self.bulk_create(
+            entries,
+            batch_size=batch_size or settings.INVENTORY_LOG_BULK_BATCH_SIZE,
+        )
@@ -0,0 +1,44 @@
+# Generated by Django 5.2 on 2026-10-17 10:12
+
+from django.db import migrations
+
+
+# Admin/search `icontains` lookups compile to `UPPER(col::text) LIKE UPPER('%q%')`
+# on PostgreSQL, so the trigram indexes are built on that exact expression.
+TRIGRAM_INDEXES = [
+    ("inventory_log_notes_trgm", "inventory_inventorylog", "notes"),
+    ("inventory_product_name_trgm", "inventory_product", "name"),
+    ("inventory_product_brand_trgm", "inventory_product", "brand"),
+    ("inventory_variant_barcode_trgm", "inventory_productvariant", "barcode"),
+    ("inventory_category_name_trgm", "inventory_category", "name"),
+]
+
+
+def create_trigram_indexes(apps, schema_editor):
+    """Create pg_trgm GIN indexes; no-op on databases other than PostgreSQL."""
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    for name, table, column in TRIGRAM_INDEXES:
+        schema_editor.execute(
+            f"CREATE INDEX IF NOT EXISTS {name} ON {table} "
+            f"USING gin ((UPPER({column}::text)) gin_trgm_ops)"
+        )
+
+
+def drop_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    for name, _table, _column in TRIGRAM_INDEXES:
+        schema_editor.execute(f"DROP INDEX IF EXISTS {name}")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('inventory', '0014_bulkupload_bulkuploaditem'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_trigram_indexes, reverse_code=drop_trigram_indexes),
+    ]
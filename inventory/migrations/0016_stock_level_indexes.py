@@ -0,0 +1,38 @@
+# Generated by Django 5.2 on 2026-10-17 12:18
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('inventory', '0015_trigram_search_indexes'),
+        ('invoice', '0006_invoice_invoice_inv_is_canc_ffb062_idx'),
+        ('supplier', '0006_add_status_and_name_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        # Superseded by the (status, quantity) and partial ACTIVE indexes below
+        migrations.RemoveIndex(
+            model_name='productvariant',
+            name='inventory_p_status_b487dd_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='productvariant',
+            name='inventory_p_quantit_b34c20_idx',
+        ),
+        migrations.AddIndex(
+            model_name='inventorylog',
+            index=models.Index(fields=['timestamp', 'transaction_type'], name='inventory_i_timesta_b1afc5_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='productvariant',
+            index=models.Index(fields=['status', 'quantity'], name='inventory_p_status_404492_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='productvariant',
+            index=models.Index(condition=models.Q(('status', 'ACTIVE')), fields=['quantity', 'minimum_quantity'], name='inventory_pv_active_stock_idx'),
+        ),
+    ]
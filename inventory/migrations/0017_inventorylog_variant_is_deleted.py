@@ -0,0 +1,27 @@
+# Generated by Django 5.2 on 2026-10-17 12:19
+
+from django.db import migrations, models
+
+
+def backfill_variant_is_deleted(apps, schema_editor):
+    """Copy is_deleted from soft-deleted variants onto their existing logs."""
+    InventoryLog = apps.get_model("inventory", "InventoryLog")
+    InventoryLog.objects.filter(variant__is_deleted=True).update(
+        variant_is_deleted=True
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('inventory', '0016_stock_level_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='inventorylog',
+            name='variant_is_deleted',
+            field=models.BooleanField(default=False, editable=False),
+        ),
+        migrations.RunPython(backfill_variant_is_deleted, reverse_code=migrations.RunPython.noop),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 5.2 on 2026-10-17 12:25
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('inventory', '0017_inventorylog_variant_is_deleted'),
+        ('invoice', '0006_invoice_invoice_inv_is_canc_ffb062_idx'),
+        ('supplier', '0006_add_status_and_name_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='inventorylog',
+            index=models.Index(fields=['-timestamp', '-id'], name='inventory_log_ts_id_desc_idx'),
+        ),
+    ]
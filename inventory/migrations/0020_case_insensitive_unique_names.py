@@ -0,0 +1,101 @@
+# Generated by Django 5.2 on 2026-10-17 12:31
+
+import django.db.models.functions.text
+from django.db import migrations, models
+from django.db.models import Count
+from django.db.models.functions import Lower
+
+
+def check_case_insensitive_duplicates(apps, schema_editor):
+    """Stop before adding the constraints if names differ only by case.
+
+    These rows were allowed under the old case-sensitive unique=True; they
+    must be renamed or merged by hand because variants and products point
+    at them.
+    """
+    duplicates = []
+    for model_name, scope in (
+        ("Category", ("parent_id",)),
+        ("ClothType", ()),
+        ("Color", ()),
+        ("Size", ()),
+    ):
+        model = apps.get_model("inventory", model_name)
+        groups = (
+            model._base_manager.annotate(name_ci=Lower("name"))
+            .values("name_ci", *scope)
+            .annotate(count=Count("id"))
+            .filter(count__gt=1)
+            .order_by()
+        )
+        for group in groups:
+            names = list(
+                model._base_manager.filter(
+                    name__iexact=group["name_ci"],
+                    **{field: group[field] for field in scope},
+                ).values_list("name", flat=True)
+            )
+            duplicates.append(f"{model_name}: {', '.join(names)}")
+    if duplicates:
+        raise RuntimeError(
+            "Rename or merge these case-insensitive duplicate names before "
+            "migrating:\n" + "\n".join(duplicates)
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('inventory', '0019_inventorylog_keyset_index'),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            check_case_insensitive_duplicates, reverse_code=migrations.RunPython.noop
+        ),
+        migrations.AlterField(
+            model_name='clothtype',
+            name='name',
+            field=models.CharField(max_length=100),
+        ),
+        migrations.AlterField(
+            model_name='color',
+            name='name',
+            field=models.CharField(max_length=50),
+        ),
+        migrations.AlterField(
+            model_name='gsthsncode',
+            name='code',
+            field=models.CharField(db_index=True, error_messages={'unique': 'A GST HSN Code with this code already exists.'}, max_length=8, unique=True),
+        ),
+        migrations.AlterField(
+            model_name='size',
+            name='name',
+            field=models.CharField(max_length=50),
+        ),
+        migrations.AlterField(
+            model_name='uom',
+            name='short_code',
+            field=models.CharField(error_messages={'unique': 'A UOM with this short code already exists.'}, help_text='Abbreviation for the UOM, e.g., pcs, doz, m', max_length=10, unique=True),
+        ),
+        migrations.AddConstraint(
+            model_name='category',
+            constraint=models.UniqueConstraint(django.db.models.functions.text.Lower('name'), models.F('parent'), name='uniq_category_name_parent_ci', violation_error_code='unique_name', violation_error_message='A category with this name already exists under this parent.'),
+        ),
+        migrations.AddConstraint(
+            model_name='category',
+            constraint=models.UniqueConstraint(django.db.models.functions.text.Lower('name'), condition=models.Q(('parent__isnull', True)), name='uniq_category_root_name_ci', violation_error_code='unique_name', violation_error_message='A category with this name already exists at root level.'),
+        ),
+        migrations.AddConstraint(
+            model_name='clothtype',
+            constraint=models.UniqueConstraint(django.db.models.functions.text.Lower('name'), name='uniq_clothtype_name_ci', violation_error_code='unique_name', violation_error_message='A cloth type with this name already exists.'),
+        ),
+        migrations.AddConstraint(
+            model_name='color',
+            constraint=models.UniqueConstraint(django.db.models.functions.text.Lower('name'), name='uniq_color_name_ci', violation_error_code='unique_name', violation_error_message='A color with this name already exists.'),
+        ),
+        migrations.AddConstraint(
+            model_name='size',
+            constraint=models.UniqueConstraint(django.db.models.functions.text.Lower('name'), name='uniq_size_name_ci', violation_error_code='unique_name', violation_error_message='A size with this name already exists.'),
+        ),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 5.2 on 2026-10-17 12:38
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('inventory', '0020_case_insensitive_unique_names'),
+        ('invoice', '0006_invoice_invoice_inv_is_canc_ffb062_idx'),
+        ('supplier', '0006_add_status_and_name_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name='inventorylog',
+            constraint=models.CheckConstraint(condition=models.Q(('purchase_price__isnull', True), ('purchase_price__gte', 0), _connector='OR'), name='inventorylog_purchase_price_non_negative', violation_error_message='Purchase price cannot be negative.'),
+        ),
+        migrations.AddConstraint(
+            model_name='productvariant',
+            constraint=models.CheckConstraint(condition=models.Q(('purchase_price__gte', 0)), name='variant_purchase_price_non_negative', violation_error_message='Purchase price cannot be negative.'),
+        ),
+        migrations.AddConstraint(
+            model_name='productvariant',
+            constraint=models.CheckConstraint(condition=models.Q(('mrp__gte', 0)), name='variant_mrp_non_negative', violation_error_message='Selling price cannot be negative.'),
+        ),
+        migrations.AddConstraint(
+            model_name='productvariant',
+            constraint=models.CheckConstraint(condition=models.Q(('damaged_quantity__gte', 0)), name='variant_damaged_quantity_non_negative', violation_error_message='Damaged quantity cannot be negative.'),
+        ),
+    ]
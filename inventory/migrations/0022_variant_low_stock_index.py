@@ -0,0 +1,24 @@
+# Generated by Django 5.2 on 2026-10-17 13:45
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('inventory', '0021_price_check_constraints'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        # The low-stock index below replaces the wider ACTIVE stock index
+        migrations.RemoveIndex(
+            model_name='productvariant',
+            name='inventory_pv_active_stock_idx',
+        ),
+        migrations.AddIndex(
+            model_name='productvariant',
+            index=models.Index(condition=models.Q(('quantity__lte', models.F('minimum_quantity')), ('status', 'ACTIVE')), fields=['quantity'], name='inventory_pv_low_stock_idx'),
+        ),
+    ]
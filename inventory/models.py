@@ -5,13 +5,18 @@ from decimal import Decimal
 from django.conf import settings
 from django.core.validators import MaxValueValidator, MinValueValidator
 from django.db import models, transaction
+from django.db.models.functions import Lower
 from django.urls import reverse
 
 from base.manager import SoftDeleteModel
 from base.utility import StringProcessor
 from supplier.models import SupplierInvoice
 
-from .manager import InventoryLogManager, ProductVariantManager
+from .manager import (
+    FavoriteVariantManager,
+    InventoryLogManager,
+    ProductVariantManager,
+)
 from .mixins import (
     ProductVariantNamingMixin,
     ProductVariantPricingMixin,
@@ -20,6 +25,9 @@ from .mixins import (
 
 User = settings.AUTH_USER_MODEL
 
+# Error code of the case-insensitive unique-name constraints on master data
+UNIQUE_NAME_ERROR_CODE = "unique_name"
+
 
 class Category(models.Model):
     """Product category for grouping products (e.g. Shirts, Trousers)."""
@@ -34,6 +42,28 @@ class Category(models.Model):
 
     class Meta:
         verbose_name_plural = "Categories"
+        constraints = [
+            # Names are unique per parent, case-insensitively. NULL parents
+            # never compare equal, so root categories need their own index.
+            models.UniqueConstraint(
+                Lower("name"),
+                models.F("parent"),
+                name="uniq_category_name_parent_ci",
+                violation_error_code=UNIQUE_NAME_ERROR_CODE,
+                violation_error_message=(
+                    "A category with this name already exists under this parent."
+                ),
+            ),
+            models.UniqueConstraint(
+                Lower("name"),
+                condition=models.Q(parent__isnull=True),
+                name="uniq_category_root_name_ci",
+                violation_error_code=UNIQUE_NAME_ERROR_CODE,
+                violation_error_message=(
+                    "A category with this name already exists at root level."
+                ),
+            ),
+        ]
 
     def __str__(self):
         if self.parent:
@@ -58,11 +88,21 @@ class Category(models.Model):
 class ClothType(models.Model):
     """Fabric / cloth type master (e.g. Cotton, Silk)."""
 
-    name = models.CharField(max_length=100, unique=True)
+    name = models.CharField(max_length=100)
     description = models.TextField(blank=True, null=True)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                Lower("name"),
+                name="uniq_clothtype_name_ci",
+                violation_error_code=UNIQUE_NAME_ERROR_CODE,
+                violation_error_message="A cloth type with this name already exists.",
+            ),
+        ]
+
     def __str__(self):
         return self.name
 
@@ -77,7 +117,7 @@ class Color(models.Model):
     Defines a specific color. e.g., Red, Blue, Pink.
     """
 
-    name = models.CharField(max_length=50, unique=True)
+    name = models.CharField(max_length=50)
     hex_code = models.CharField(
         max_length=7,
         blank=True,
@@ -87,6 +127,16 @@ class Color(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                Lower("name"),
+                name="uniq_color_name_ci",
+                violation_error_code=UNIQUE_NAME_ERROR_CODE,
+                violation_error_message="A color with this name already exists.",
+            ),
+        ]
+
     def __str__(self):
         return self.name
 
@@ -99,12 +149,22 @@ class Color(models.Model):
 class Size(models.Model):
     """Size master for product variants (e.g. S, M, L, XL)."""
 
-    name = models.CharField(max_length=50, unique=True)
+    name = models.CharField(max_length=50)
     description = models.TextField(blank=True, null=True)
 
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                Lower("name"),
+                name="uniq_size_name_ci",
+                violation_error_code=UNIQUE_NAME_ERROR_CODE,
+                violation_error_message="A size with this name already exists.",
+            ),
+        ]
+
     def __str__(self):
         return self.name
 
@@ -129,6 +189,7 @@ class UOM(models.Model):
     short_code = models.CharField(
         max_length=10,
         unique=True,
+        error_messages={"unique": "A UOM with this short code already exists."},
         help_text="Abbreviation for the UOM, e.g., pcs, doz, m",
     )
     category = models.CharField(
@@ -173,7 +234,12 @@ class UOM(models.Model):
 class GSTHsnCode(models.Model):
     """GST HSN code with tax rates for product classification."""
 
-    code = models.CharField(max_length=8, unique=True, db_index=True)
+    code = models.CharField(
+        max_length=8,
+        unique=True,
+        db_index=True,
+        error_messages={"unique": "A GST HSN Code with this code already exists."},
+    )
     gst_percentage = models.DecimalField(
         max_digits=5,
         decimal_places=2,
@@ -334,14 +400,39 @@ class ProductVariant(
                 name="unique_product_color_null_size",
                 condition=models.Q(size__isnull=True, color__isnull=False),
             ),
+            # Prices are never negative. Stock itself can go negative on an
+            # oversold sale, so quantity is deliberately left unconstrained.
+            models.CheckConstraint(
+                condition=models.Q(purchase_price__gte=0),
+                name="variant_purchase_price_non_negative",
+                violation_error_message="Purchase price cannot be negative.",
+            ),
+            models.CheckConstraint(
+                condition=models.Q(mrp__gte=0),
+                name="variant_mrp_non_negative",
+                violation_error_message="Selling price cannot be negative.",
+            ),
+            models.CheckConstraint(
+                condition=models.Q(damaged_quantity__gte=0),
+                name="variant_damaged_quantity_non_negative",
+                violation_error_message="Damaged quantity cannot be negative.",
+            ),
         ]
         indexes = [
-            models.Index(fields=["status"]),
             models.Index(fields=["barcode"]),
             models.Index(fields=["created_at"]),
             models.Index(fields=["product", "status"]),
-            models.Index(fields=["quantity", "minimum_quantity"]),
             models.Index(fields=["is_deleted", "status"]),
+            # Status filters and out-of-stock counts on active variants
+            models.Index(fields=["status", "quantity"]),
+            # Only rows at or below their reorder level, for low_stock()
+            models.Index(
+                fields=["quantity"],
+                condition=models.Q(
+                    status="ACTIVE", quantity__lte=models.F("minimum_quantity")
+                ),
+                name="inventory_pv_low_stock_idx",
+            ),
         ]
 
     product = models.ForeignKey(
@@ -479,18 +570,6 @@ class ProductVariant(
             # Fallback if anything goes wrong
             return f"Product Variant #{self.id}"
 
-    def clean(self):
-        """Custom validation"""
-        from django.core.exceptions import ValidationError
-
-        # Validate barcode uniqueness
-        if self.barcode:
-            existing = ProductVariant.objects.filter(barcode=self.barcode)
-            if self.pk:
-                existing = existing.exclude(pk=self.pk)
-            if existing.exists():
-                raise ValidationError("Barcode must be unique")
-
     def create_barcode(self, save=True):
         """
         Create a new barcode based on the object's ID.
@@ -517,9 +596,8 @@ class ProductVariant(
         return self.barcode
 
     def save(self, *args, **kwargs):
-        """Override save to include validation"""
-        self.clean()
-
+        """Override save to generate a barcode for new variants"""
+        # Barcode uniqueness is enforced by the unique index (IntegrityError)
         # If new record and no barcode, generate after getting ID
         if not self.pk and not self.barcode:
             super().save(*args, **kwargs)  # First save to get ID
@@ -527,6 +605,24 @@ class ProductVariant(
         else:
             super().save(*args, **kwargs)
 
+    def soft_delete(self):
+        """Soft delete the variant and flag its inventory logs."""
+        with transaction.atomic():
+            super().soft_delete()
+            self._sync_log_variant_is_deleted()
+
+    def restore(self):
+        """Restore the variant and unflag its inventory logs."""
+        with transaction.atomic():
+            super().restore()
+            self._sync_log_variant_is_deleted()
+
+    def _sync_log_variant_is_deleted(self):
+        """Copy is_deleted onto the denormalized InventoryLog column."""
+        InventoryLog.all_objects.filter(variant=self).exclude(
+            variant_is_deleted=self.is_deleted
+        ).update(variant_is_deleted=self.is_deleted)
+
 
 class VariantMedia(models.Model):
     """Media (image or video) associated with a product variant."""
@@ -773,6 +869,8 @@ class InventoryLog(SoftDeleteModel):
         default=Decimal("0"),
     )
     notes = models.TextField(blank=True, null=True)
+    # Denormalized copy of variant.is_deleted so reporting filters avoid a join
+    variant_is_deleted = models.BooleanField(default=False, editable=False)
     timestamp = models.DateTimeField(auto_now_add=True)
     created_by = models.ForeignKey(
         User,
@@ -788,6 +886,14 @@ class InventoryLog(SoftDeleteModel):
 
     class Meta:
         ordering = ["-timestamp"]
+        constraints = [
+            models.CheckConstraint(
+                condition=models.Q(purchase_price__isnull=True)
+                | models.Q(purchase_price__gte=0),
+                name="inventorylog_purchase_price_non_negative",
+                violation_error_message="Purchase price cannot be negative.",
+            ),
+        ]
         indexes = [
             # Existing indexes
             models.Index(fields=["variant", "timestamp"]),
@@ -802,6 +908,12 @@ class InventoryLog(SoftDeleteModel):
             # Performance indexes for cross-model FK lookups
             models.Index(fields=["invoice_item"]),
             models.Index(fields=["source_inventory_log"]),
+            # Recent-activity windows filtered by timestamp first
+            models.Index(fields=["timestamp", "transaction_type"]),
+            # Admin changelist page-boundary lookups on (-timestamp, -pk)
+            models.Index(
+                fields=["-timestamp", "-id"], name="inventory_log_ts_id_desc_idx"
+            ),
         ]
 
     def __str__(self):
@@ -827,6 +939,9 @@ class InventoryLog(SoftDeleteModel):
         ):
             self.remaining_quantity = abs(self.quantity_change)
 
+        if self._state.adding and self.variant_id:
+            self.variant_is_deleted = self.variant.is_deleted
+
         super().save(*args, **kwargs)
 
 
@@ -842,6 +957,8 @@ class FavoriteVariant(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = FavoriteVariantManager()
+
     def __str__(self):
         return f"{self.user.full_name} - {self.variant.full_name}"
 
@@ -4,7 +4,7 @@ import logging
 from decimal import Decimal, InvalidOperation
 
 from django.db import transaction
-from django.db.models import Sum
+from django.db.models import Case, DecimalField, F, Sum, Value, When
 from django.urls import reverse
 from django.utils import timezone
 
@@ -45,7 +45,7 @@ class InventoryService:
         if 0 <= percentage <= 100:
             with transaction.atomic():
                 variant.discount_percentage = percentage
-                variant.save()
+                variant.save(update_fields=["discount_percentage", "updated_at"])
 
                 InventoryLog.objects.create(
                     variant=variant,
@@ -62,7 +62,7 @@ class InventoryService:
         with transaction.atomic():
             new_quantity = variant.quantity + change
             variant.quantity = new_quantity
-            variant.save()
+            variant.save(update_fields=["quantity", "updated_at"])
 
             InventoryLog.objects.create(
                 variant=variant,
@@ -84,7 +84,7 @@ class InventoryService:
 
             new_quantity = variant.quantity + change
             variant.quantity = new_quantity
-            variant.save()
+            variant.save(update_fields=["quantity", "updated_at"])
 
             InventoryLog.objects.create(
                 variant=variant,
@@ -96,6 +96,24 @@ class InventoryService:
                 notes=notes or f"Adjustment In: {change} units",
             )
 
+    @staticmethod
+    def _take_stock(variant, quantity, damaged=False):
+        """Atomically remove ``quantity`` from available stock.
+
+        The stock check and decrement happen in one conditional UPDATE, so
+        concurrent requests cannot both pass a check on a stale quantity.
+        Raises ValueError if the row no longer has enough stock.
+        """
+        updates = {"quantity": F("quantity") - quantity, "updated_at": timezone.now()}
+        if damaged:
+            updates["damaged_quantity"] = F("damaged_quantity") + quantity
+        updated = ProductVariant.objects.filter(
+            pk=variant.pk, quantity__gte=quantity
+        ).update(**updates)
+        variant.refresh_from_db(fields=["quantity", "damaged_quantity", "updated_at"])
+        if not updated:
+            raise ValueError(f"Insufficient stock. Available stock: {variant.quantity}")
+
     @staticmethod
     def adjust_out_quantity(variant, change, user=None, notes=""):
         """Adjust quantity and create log entry"""
@@ -103,9 +121,8 @@ class InventoryService:
             if change == 0:
                 raise ValueError("Quantity change cannot be zero")
 
-            new_quantity = variant.quantity - change
-            variant.quantity = new_quantity
-            variant.save()
+            InventoryService._take_stock(variant, change)
+            new_quantity = variant.quantity
 
             InventoryLog.objects.create(
                 variant=variant,
@@ -117,6 +134,78 @@ class InventoryService:
                 notes=notes or f"Adjustment Out: {change} units",
             )
 
+    @staticmethod
+    def bulk_adjust_quantities(deltas, user=None, notes=""):
+        """Apply signed quantity deltas to many variants in one UPDATE.
+
+        Args:
+            deltas (dict): Mapping of variant pk to signed Decimal change.
+                Positive values are logged as ADJUSTMENT_IN, negative as
+                ADJUSTMENT_OUT; zero deltas are ignored.
+            user: User recorded on the generated inventory logs.
+            notes (str): Optional note for every generated log.
+
+        Returns:
+            int: Number of variants adjusted.
+
+        Raises:
+            ValueError: If any adjustment would make stock negative.
+        """
+        deltas = {pk: change for pk, change in deltas.items() if change}
+        if not deltas:
+            return 0
+
+        with transaction.atomic():
+            variants = list(
+                ProductVariant.objects.select_for_update()
+                .filter(pk__in=deltas)
+                .only("pk", "quantity", "purchase_price", "is_deleted")
+            )
+            for variant in variants:
+                if variant.quantity + deltas[variant.pk] < 0:
+                    raise ValueError(
+                        f"Insufficient stock for variant #{variant.pk}. "
+                        f"Available: {variant.quantity}, "
+                        f"Requested: {abs(deltas[variant.pk])}"
+                    )
+
+            ProductVariant.objects.filter(pk__in=deltas).update(
+                quantity=Case(
+                    *[
+                        When(pk=pk, then=F("quantity") + Value(change))
+                        for pk, change in deltas.items()
+                    ],
+                    default=F("quantity"),
+                    output_field=DecimalField(max_digits=10, decimal_places=2),
+                ),
+                updated_at=timezone.now(),
+            )
+
+            logs = []
+            for variant in variants:
+                change = deltas[variant.pk]
+                if change > 0:
+                    transaction_type = InventoryLog.TransactionTypes.ADJUSTMENT_IN
+                    label = "Adjustment In"
+                else:
+                    transaction_type = InventoryLog.TransactionTypes.ADJUSTMENT_OUT
+                    label = "Adjustment Out"
+                logs.append(
+                    InventoryLog(
+                        variant=variant,
+                        created_by=user,
+                        quantity_change=change,
+                        new_quantity=variant.quantity + change,
+                        transaction_type=transaction_type,
+                        total_value=abs(change) * variant.purchase_price,
+                        notes=notes or f"{label}: {abs(change)} units",
+                        variant_is_deleted=variant.is_deleted,
+                    )
+                )
+            InventoryLog.objects.log_bulk(logs)
+
+        return len(variants)
+
     @staticmethod
     def create_initial_log(variant, user=None, notes="", supplier_invoice=None):
         """Create initial log entry for a new variant"""
@@ -230,7 +319,7 @@ class InventoryService:
                 if mrp is not None and mrp != variant.mrp:
                     variant.mrp = mrp
 
-                variant.save()
+                variant.save(update_fields=["quantity", "purchase_price", "mrp", "updated_at"])
 
                 inventory_log = InventoryLog.objects.create(
                     variant=variant,
@@ -289,7 +378,7 @@ class InventoryService:
             # Update variant quantity AFTER FIFO allocation
             new_quantity = variant.quantity - quantity_sold
             variant.quantity = new_quantity
-            variant.save()
+            variant.save(update_fields=["quantity", "updated_at"])
 
             return {
                 "success": True,
@@ -445,7 +534,7 @@ class InventoryService:
 
             new_quantity = variant.quantity + quantity_returned
             variant.quantity = new_quantity
-            variant.save()
+            variant.save(update_fields=["quantity", "updated_at"])
 
             inventory_log = InventoryLog.objects.filter(
                 variant=variant,
@@ -509,7 +598,7 @@ class InventoryService:
 
             new_quantity = variant.quantity + quantity_cancelled
             variant.quantity = new_quantity
-            variant.save()
+            variant.save(update_fields=["quantity", "updated_at"])
 
             inventory_log = InventoryLog.objects.filter(
                 variant=variant,
@@ -559,15 +648,13 @@ class InventoryService:
             if quantity_damaged <= 0:
                 raise ValueError("Damaged quantity must be positive")
 
-            if quantity_damaged > variant.quantity:
+            # Move from available to damaged
+            try:
+                InventoryService._take_stock(variant, quantity_damaged, damaged=True)
+            except ValueError:
                 raise ValueError(
                     f"Insufficient stock to mark as damaged. Available stock: {variant.quantity}"
-                )
-
-            # Move from available to damaged
-            variant.quantity -= quantity_damaged
-            variant.damaged_quantity += quantity_damaged
-            variant.save()
+                ) from None
 
             formatted_notes = f"Marked as damaged: {quantity_damaged} units - {damage_type}. {notes}".strip()
 
@@ -821,7 +908,7 @@ class InventoryService:
             variant = inventory_log.variant
             if purchase_price is not None and purchase_price > 0:
                 variant.purchase_price = Decimal(str(purchase_price))
-                variant.save()
+                variant.save(update_fields=["purchase_price", "updated_at"])
 
             # Propagate supplier invoice & purchase price to directly allocated child SALE and DAMAGE logs
             child_logs = InventoryLog.objects.filter(source_inventory_log=inventory_log)
@@ -925,7 +1012,7 @@ class DamageResolutionService:
                 )
 
             variant.damaged_quantity -= record.quantity
-            variant.save()
+            variant.save(update_fields=["damaged_quantity", "updated_at"])
 
             resolved_user = user if (user and getattr(user, "is_authenticated", True)) else None
             record.supplier = supplier or (supplier_invoice.supplier if supplier_invoice else None)
@@ -953,7 +1040,7 @@ class DamageResolutionService:
                 )
 
             variant.damaged_quantity -= record.quantity
-            variant.save()
+            variant.save(update_fields=["damaged_quantity", "updated_at"])
 
             resolved_user = user if (user and getattr(user, "is_authenticated", True)) else None
             record.status = DamagedItemRecord.Status.WRITTEN_OFF
@@ -995,7 +1082,9 @@ class DamageResolutionService:
 
             variant.damaged_quantity -= record.quantity
             variant.quantity += record.quantity
-            variant.save()
+            variant.save(
+                update_fields=["quantity", "damaged_quantity", "updated_at"]
+            )
 
             resolved_user = user if (user and getattr(user, "is_authenticated", True)) else None
 
@@ -1344,8 +1433,14 @@ class BulkUploadService:
         return all_committed
 
     @classmethod
-    def commit_item(cls, item, user, data=None):
-        """Commit a single BulkUploadItem to inventory (Product & ProductVariant)."""
+    def commit_item(cls, item, user, data=None, variant_cache=None):
+        """Commit a single BulkUploadItem to inventory (Product & ProductVariant).
+
+        ``variant_cache`` maps (product_id, size_id, color_id) to the pks of
+        variants already resolved earlier in the same batch, so repeated rows
+        skip the attribute lookup. The variant itself is re-fetched by pk, so
+        its quantity is never carried over stale from an earlier row.
+        """
         batch = item.bulk_upload
 
         if data and isinstance(data, dict):
@@ -1425,6 +1520,12 @@ class BulkUploadService:
 
                 # 2. ProductVariant creation or lookup
                 variant = item.variant
+                variant_key = (product.pk, item.size_id, item.color_id)
+                matched_by_key = not variant
+                if not variant and variant_cache is not None:
+                    variant_pk = variant_cache.get(variant_key)
+                    if variant_pk is not None:
+                        variant = ProductVariant.objects.filter(pk=variant_pk).first()
                 if not variant:
                     variant = ProductVariant.objects.filter(
                         product=product,
@@ -1470,7 +1571,15 @@ class BulkUploadService:
                         variant.discount_percentage = item.discount_percentage
                         if item.commission_percentage:
                             variant.commission_percentage = item.commission_percentage
-                        variant.save()
+                        variant.save(
+                            update_fields=[
+                                "purchase_price",
+                                "mrp",
+                                "discount_percentage",
+                                "commission_percentage",
+                                "updated_at",
+                            ]
+                        )
 
                 # Link back to item and mark status as COMMITTED
                 item.product = product
@@ -1480,6 +1589,10 @@ class BulkUploadService:
 
                 all_committed = cls.recalculate_batch_status(batch)
 
+            # Only remember the variant once its savepoint has committed
+            if variant_cache is not None and matched_by_key:
+                variant_cache[variant_key] = variant.pk
+
             variant_url = reverse("inventory_variant:details", kwargs={"variant_id": variant.id})
             barcode_url = reverse("report:barcode", kwargs={"pk": variant.id})
             return {
@@ -1512,9 +1625,10 @@ class BulkUploadService:
 
         committed_count = 0
         errors = []
+        variant_cache = {}
         with transaction.atomic():
             for item in uncommitted_items:
-                res = cls.commit_item(item, user)
+                res = cls.commit_item(item, user, variant_cache=variant_cache)
                 if res.get("success"):
                     committed_count += 1
                 else:
@@ -0,0 +1,81 @@
+"""
+Django signals for the Inventory app.
+
+Drops cached form dropdown choices when their source rows change.
+"""
+
+from django.core.cache import cache
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from supplier.models import Supplier, SupplierInvoice
+
+from .forms import (
+    HSN_CHOICES_KEY,
+    HSN_GST_RATES_KEY,
+    RECENT_SUPPLIER_INVOICE_CHOICES_KEY,
+    SUPPLIER_INVOICE_CHOICES_KEY,
+    SUPPLIER_INVOICE_TYPES_KEY,
+    UOM_CHOICES_KEY,
+    VARIANT_CHOICES_KEY,
+)
+from .models import (
+    UOM,
+    Color,
+    GSTHsnCode,
+    Product,
+    ProductVariant,
+    Size,
+)
+
+# ProductVariant columns the cached variant dropdown filters on or labels with
+VARIANT_CHOICE_FIELDS = frozenset({"barcode", "extra_attributes", "is_deleted"})
+
+
+@receiver(post_save, sender=SupplierInvoice)
+@receiver(post_delete, sender=SupplierInvoice)
+@receiver(post_save, sender=Supplier)
+@receiver(post_delete, sender=Supplier)
+def invalidate_supplier_invoice_choices(sender, **kwargs):
+    """Drop cached supplier invoice dropdowns."""
+    cache.delete_many(
+        [
+            SUPPLIER_INVOICE_CHOICES_KEY,
+            RECENT_SUPPLIER_INVOICE_CHOICES_KEY,
+            SUPPLIER_INVOICE_TYPES_KEY,
+        ]
+    )
+
+
+@receiver(post_save, sender=ProductVariant)
+def invalidate_variant_choices_on_save(sender, update_fields=None, **kwargs):
+    """Drop cached variant dropdowns unless only stock/price columns changed."""
+    if update_fields is not None and VARIANT_CHOICE_FIELDS.isdisjoint(update_fields):
+        return
+    cache.delete(VARIANT_CHOICES_KEY)
+
+
+@receiver(post_delete, sender=ProductVariant)
+@receiver(post_save, sender=Product)
+@receiver(post_delete, sender=Product)
+@receiver(post_save, sender=Size)
+@receiver(post_delete, sender=Size)
+@receiver(post_save, sender=Color)
+@receiver(post_delete, sender=Color)
+def invalidate_variant_choices(sender, **kwargs):
+    """Drop cached variant dropdowns."""
+    cache.delete(VARIANT_CHOICES_KEY)
+
+
+@receiver(post_save, sender=GSTHsnCode)
+@receiver(post_delete, sender=GSTHsnCode)
+def invalidate_hsn_choices(sender, **kwargs):
+    """Drop cached HSN code dropdowns and their GST rates."""
+    cache.delete_many([HSN_CHOICES_KEY, HSN_GST_RATES_KEY])
+
+
+@receiver(post_save, sender=UOM)
+@receiver(post_delete, sender=UOM)
+def invalidate_uom_choices(sender, **kwargs):
+    """Drop cached UOM dropdowns."""
+    cache.delete(UOM_CHOICES_KEY)
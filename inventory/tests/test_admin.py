@@ -0,0 +1,288 @@
+"""Tests for inventory/admin.py changelist and change-form behaviour."""
+
+from decimal import Decimal
+from unittest.mock import patch
+
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from inventory.admin import (
+    InventoryLogAdmin,
+    ProductVariantAdmin,
+    get_inventory_stats,
+)
+from inventory.models import (
+    Category,
+    Color,
+    InventoryLog,
+    Product,
+    ProductVariant,
+    Size,
+)
+from Billing.tests.helpers import create_test_user, create_test_variant
+
+
+class InventoryLogInlineTests(TestCase):
+    """The variant change page only loads the most recent inventory logs."""
+
+    def setUp(self):
+        self.user = create_test_user(is_staff=True, is_superuser=True)
+        self.client.force_login(self.user)
+        self.variant = create_test_variant(user=self.user)
+        for i in range(15):
+            InventoryLog.objects.create(
+                variant=self.variant,
+                transaction_type=InventoryLog.TransactionTypes.ADJUSTMENT_IN,
+                quantity_change=Decimal("1"),
+                new_quantity=Decimal(i),
+                notes=f"log {i}",
+                created_by=self.user,
+            )
+
+    def test_inline_is_limited_to_max_num(self):
+        url = reverse("admin:inventory_productvariant_change", args=[self.variant.pk])
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        inline_formsets = [
+            f for f in response.context["inline_admin_formsets"]
+            if f.formset.model is InventoryLog
+        ]
+        self.assertEqual(len(inline_formsets), 1)
+        forms = inline_formsets[0].formset.initial_forms
+        self.assertEqual(len(forms), 10)
+        self.assertEqual(forms[0].instance.notes, "log 14")
+
+
+class ProductVariantAdminActionTests(TestCase):
+    """Bulk status actions update every selected variant across chunks."""
+
+    def setUp(self):
+        self.user = create_test_user(is_staff=True, is_superuser=True)
+        self.client.force_login(self.user)
+        self.variants = [create_test_variant(user=self.user) for _ in range(5)]
+
+    def test_mark_as_discontinued_updates_in_chunks(self):
+        url = reverse("admin:inventory_productvariant_changelist")
+        with patch.object(ProductVariantAdmin, "update_chunk_size", 2):
+            response = self.client.post(
+                url,
+                {
+                    "action": "mark_as_discontinued",
+                    "_selected_action": [v.pk for v in self.variants],
+                },
+            )
+        self.assertEqual(response.status_code, 302)
+        self.assertEqual(
+            ProductVariant.objects.filter(
+                status=ProductVariant.VariantStatus.DISCONTINUED
+            ).count(),
+            5,
+        )
+
+    def test_adjust_quantities_renders_intermediate_form(self):
+        url = reverse("admin:inventory_productvariant_changelist")
+        response = self.client.post(
+            url,
+            {
+                "action": "adjust_quantities",
+                "_selected_action": [v.pk for v in self.variants[:2]],
+            },
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, f'name="delta_{self.variants[0].pk}"')
+
+    def test_adjust_quantities_applies_deltas_and_logs(self):
+        url = reverse("admin:inventory_productvariant_changelist")
+        first, second = self.variants[:2]
+        response = self.client.post(
+            url,
+            {
+                "action": "adjust_quantities",
+                "apply": "1",
+                "_selected_action": [first.pk, second.pk],
+                f"delta_{first.pk}": "5",
+                f"delta_{second.pk}": "-3",
+                "notes": "Recount",
+            },
+        )
+        self.assertEqual(response.status_code, 302)
+        first.refresh_from_db()
+        second.refresh_from_db()
+        self.assertEqual(first.quantity, Decimal("55"))
+        self.assertEqual(second.quantity, Decimal("47"))
+        out_log = InventoryLog.objects.get(variant=second)
+        self.assertEqual(
+            out_log.transaction_type, InventoryLog.TransactionTypes.ADJUSTMENT_OUT
+        )
+        self.assertEqual(out_log.quantity_change, Decimal("-3"))
+        self.assertEqual(out_log.new_quantity, Decimal("47"))
+
+    def test_adjust_quantities_rejects_negative_stock(self):
+        url = reverse("admin:inventory_productvariant_changelist")
+        variant = self.variants[0]
+        self.client.post(
+            url,
+            {
+                "action": "adjust_quantities",
+                "apply": "1",
+                "_selected_action": [variant.pk],
+                f"delta_{variant.pk}": "-500",
+            },
+        )
+        variant.refresh_from_db()
+        self.assertEqual(variant.quantity, Decimal("50"))
+        self.assertFalse(InventoryLog.objects.filter(variant=variant).exists())
+
+
+class ProductVariantChangeListTests(TestCase):
+    """The variant changelist renders without per-row queries."""
+
+    def setUp(self):
+        self.user = create_test_user(is_staff=True, is_superuser=True)
+        self.client.force_login(self.user)
+        size = Size.objects.create(name="M")
+        color = Color.objects.create(name="Red")
+        for _ in range(3):
+            variant = create_test_variant(user=self.user)
+            variant.size = size
+            variant.color = color
+            variant.save()
+
+    def test_changelist_query_count_is_independent_of_rows(self):
+        url = reverse("admin:inventory_productvariant_changelist")
+        self.client.get(url)  # warm session/content-type caches
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        baseline = len(ctx.captured_queries)
+
+        create_test_variant(user=self.user)
+        with CaptureQueriesContext(connection) as ctx:
+            self.client.get(url)
+        self.assertEqual(len(ctx.captured_queries), baseline)
+
+    def test_computed_columns_match_model_properties(self):
+        url = reverse("admin:inventory_productvariant_changelist")
+        variant = create_test_variant(user=self.user)
+        variant.discount_percentage = Decimal("10")
+        variant.minimum_quantity = Decimal("60")
+        variant.save()
+        response = self.client.get(url)
+        row = next(
+            obj for obj in response.context["cl"].result_list if obj.pk == variant.pk
+        )
+        self.assertEqual(row.final_price_db, variant.final_price)
+        self.assertEqual(row.total_value_db, variant.total_value)
+        self.assertEqual(row.stock_status_db, variant.stock_status)
+
+    def test_display_name_matches_get_name(self):
+        url = reverse("admin:inventory_productvariant_changelist")
+        bare = create_test_variant(user=self.user)
+        response = self.client.get(url)
+        for obj in response.context["cl"].result_list:
+            self.assertEqual(
+                obj.display_name_db,
+                obj.get_name(include_barcode=False, include_variants=True),
+            )
+        self.assertIn(bare.pk, [obj.pk for obj in response.context["cl"].result_list])
+
+
+class InventoryLogAdminTests(TestCase):
+    """The inventory log change form renders dropdowns without N+1 queries."""
+
+    def setUp(self):
+        self.user = create_test_user(is_staff=True, is_superuser=True)
+        self.client.force_login(self.user)
+        self.variant = create_test_variant(user=self.user)
+        self.log = InventoryLog.objects.create(
+            variant=self.variant,
+            transaction_type=InventoryLog.TransactionTypes.ADJUSTMENT_IN,
+            quantity_change=Decimal("1"),
+            created_by=self.user,
+        )
+
+    def test_change_form_query_count_is_independent_of_variants(self):
+        url = reverse("admin:inventory_inventorylog_change", args=[self.log.pk])
+        self.client.get(url)
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        baseline = len(ctx.captured_queries)
+
+        for _ in range(3):
+            create_test_variant(user=self.user)
+        with CaptureQueriesContext(connection) as ctx:
+            self.client.get(url)
+        self.assertEqual(len(ctx.captured_queries), baseline)
+
+
+class InventoryStatsTests(TestCase):
+    """get_inventory_stats matches the per-metric ORM queries."""
+
+    def setUp(self):
+        self.user = create_test_user()
+        self.variant = create_test_variant(user=self.user)
+        out_of_stock = create_test_variant(user=self.user)
+        out_of_stock.quantity = Decimal("0")
+        out_of_stock.save()
+        Size.objects.create(name="M")
+        InventoryLog.objects.create(
+            variant=self.variant,
+            transaction_type=InventoryLog.TransactionTypes.SALE,
+            quantity_change=Decimal("-4"),
+            created_by=self.user,
+        )
+
+    def test_stats_values(self):
+        stats = get_inventory_stats()
+        self.assertEqual(stats["total_products"], Product.objects.count())
+        self.assertEqual(stats["total_variants"], 2)
+        self.assertEqual(stats["total_categories"], Category.objects.count())
+        self.assertEqual(stats["total_sizes"], 1)
+        self.assertEqual(stats["active_variants"], 2)
+        self.assertEqual(stats["out_of_stock"], 1)
+        self.assertEqual(
+            stats["total_inventory_value"],
+            self.variant.quantity * self.variant.purchase_price,
+        )
+        self.assertEqual(stats["recent_transactions"], 1)
+        self.assertEqual(stats["recent_sales"], Decimal("4"))
+        self.assertEqual(stats["recent_stock_in"], 0)
+
+
+class InventoryLogIndexOffsetPaginationTests(TestCase):
+    """Index-offset pages match the rows plain offset pagination would return."""
+
+    def setUp(self):
+        self.user = create_test_user(is_staff=True, is_superuser=True)
+        self.client.force_login(self.user)
+        variant = create_test_variant(user=self.user)
+        InventoryLog.objects.bulk_create(
+            InventoryLog(
+                variant=variant,
+                transaction_type=InventoryLog.TransactionTypes.ADJUSTMENT_IN,
+                quantity_change=Decimal("1"),
+                new_quantity=Decimal(i),
+                created_by=self.user,
+            )
+            for i in range(7)
+        )
+        # Give several logs the same timestamp to exercise the pk tie-break
+        InventoryLog.objects.update(timestamp=InventoryLog.objects.first().timestamp)
+
+    def test_pages_match_offset_ordering(self):
+        url = reverse("admin:inventory_inventorylog_changelist")
+        expected = list(
+            InventoryLog.objects.order_by("-timestamp", "-pk").values_list(
+                "pk", flat=True
+            )
+        )
+        seen = []
+        with patch.object(InventoryLogAdmin, "list_per_page", 3):
+            for page in (1, 2, 3):
+                response = self.client.get(url, {"p": page})
+                self.assertEqual(response.status_code, 200)
+                seen.extend(obj.pk for obj in response.context["cl"].result_list)
+        self.assertEqual(seen, expected)
@@ -0,0 +1,485 @@
+"""Tests for inventory/forms.py dropdown and validation behaviour."""
+
+from decimal import Decimal
+
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from inventory.forms import (
+    HSN_CHOICES_KEY,
+    HSN_GST_RATES_KEY,
+    UOM_CHOICES_KEY,
+    SUPPLIER_INVOICE_CHOICES_KEY,
+    SUPPLIER_INVOICE_TYPES_KEY,
+    VARIANT_CHOICES_KEY,
+    AdjustmentOutForm,
+    CategoryForm,
+    ColorForm,
+    DamageForm,
+    GSTHsnCodeForm,
+    InventoryPriceUpdateForm,
+    ProductForm,
+    ProductVariantAdminForm,
+    StockInForm,
+    UOMForm,
+    VariantForm,
+)
+from inventory.models import Category, Color, InventoryLog, Size, UOM
+from supplier.models import SupplierInvoice
+from Billing.tests.helpers import (
+    create_test_hsn_code,
+    create_test_supplier,
+    create_test_supplier_invoice,
+    create_test_user,
+    create_test_variant,
+)
+
+
+class CachedChoicesTests(TestCase):
+    """Variant and supplier invoice dropdowns are served from the cache."""
+
+    def setUp(self):
+        cache.delete_many(
+            [SUPPLIER_INVOICE_CHOICES_KEY, SUPPLIER_INVOICE_TYPES_KEY, VARIANT_CHOICES_KEY]
+        )
+        self.user = create_test_user()
+        self.variant = create_test_variant(user=self.user)
+        self.supplier = create_test_supplier(user=self.user)
+        self.invoice = create_test_supplier_invoice(supplier=self.supplier)
+
+    def test_second_render_reuses_cached_choices(self):
+        str(StockInForm()["variant"])
+        str(StockInForm()["supplier_invoice"])
+        with CaptureQueriesContext(connection) as ctx:
+            html = str(StockInForm()["variant"])
+        self.assertEqual(len(ctx.captured_queries), 0)
+        self.assertIn(f'value="{self.variant.pk}"', html)
+
+    def test_cache_miss_builds_labels_in_one_query(self):
+        for _ in range(3):
+            create_test_variant(user=self.user)
+        with CaptureQueriesContext(connection) as ctx:
+            html = str(StockInForm()["variant"])
+        self.assertEqual(len(ctx.captured_queries), 1)
+        self.assertIn(str(self.variant), html)
+
+    def test_label_query_projects_only_label_columns(self):
+        for form_class in (StockInForm, AdjustmentOutForm):
+            cache.delete(VARIANT_CHOICES_KEY)
+            with CaptureQueriesContext(connection) as ctx:
+                str(form_class()["variant"])
+            (query,) = ctx.captured_queries
+            self.assertIn("inventory_size", query["sql"])
+            self.assertNotIn("purchase_price", query["sql"])
+
+    def test_invoice_options_render_without_per_option_queries(self):
+        for _ in range(3):
+            create_test_supplier_invoice(supplier=self.supplier)
+        str(StockInForm()["supplier_invoice"])
+        with CaptureQueriesContext(connection) as ctx:
+            html = str(StockInForm()["supplier_invoice"])
+        self.assertEqual(len(ctx.captured_queries), 0)
+        self.assertEqual(
+            html.count("data-invoice-type"), SupplierInvoice.objects.count()
+        )
+
+    def test_new_rows_invalidate_cached_choices(self):
+        str(StockInForm()["supplier_invoice"])
+        new_invoice = create_test_supplier_invoice(supplier=self.supplier)
+        html = str(StockInForm()["supplier_invoice"])
+        self.assertIn(f'value="{new_invoice.pk}"', html)
+
+    def test_stock_update_keeps_cached_variant_choices(self):
+        str(StockInForm()["variant"])
+        self.variant.quantity += 5
+        self.variant.save(update_fields=["quantity", "updated_at"])
+        self.assertIsNotNone(cache.get(VARIANT_CHOICES_KEY))
+
+    def test_renaming_size_invalidates_cached_variant_choices(self):
+        size = Size.objects.create(name="XL")
+        self.variant.size = size
+        self.variant.save()
+        str(StockInForm()["variant"])
+        size.name = "XXL"
+        size.save()
+        self.assertIsNone(cache.get(VARIANT_CHOICES_KEY))
+        self.assertIn("XXL", str(StockInForm()["variant"]))
+
+    def test_validation_uses_live_queryset(self):
+        form = StockInForm(
+            data={
+                "variant": self.variant.pk,
+                "quantity_change": "5",
+                "purchase_price": "100",
+                "mrp": "200",
+            }
+        )
+        self.assertTrue(form.is_valid(), form.errors)
+        self.assertEqual(form.cleaned_data["variant"], self.variant)
+
+
+class UniqueNameConstraintTests(TestCase):
+    """Duplicate master-data names are rejected via the model constraints."""
+
+    def test_color_name_is_case_insensitive_unique(self):
+        Color.objects.create(name="Red")
+        form = ColorForm(data={"name": "  RED ", "hex_code": ""})
+        self.assertFalse(form.is_valid())
+        self.assertEqual(
+            form.errors["name"], ["A color with this name already exists."]
+        )
+        self.assertFalse(form.non_field_errors())
+
+    def test_category_name_unique_per_parent(self):
+        women = Category.objects.create(name="Women")
+        men = Category.objects.create(name="Men")
+        Category.objects.create(name="Inners", parent=women)
+        self.assertTrue(CategoryForm(data={"name": "inners", "parent": men.pk}).is_valid())
+        self.assertFalse(
+            CategoryForm(data={"name": "inners", "parent": women.pk}).is_valid()
+        )
+        form = CategoryForm(data={"name": "women"})
+        self.assertFalse(form.is_valid())
+        self.assertEqual(
+            form.errors["name"],
+            ["A category with this name already exists at root level."],
+        )
+
+    def test_uom_short_code_duplicate_message(self):
+        UOM.objects.create(name="Piece", short_code="PCS", category="Quantity")
+        form = UOMForm(
+            data={
+                "name": "Pieces",
+                "short_code": "pcs",
+                "category": "Quantity",
+                "conversion_factor": "1",
+            }
+        )
+        self.assertFalse(form.is_valid())
+        self.assertEqual(
+            form.errors["short_code"], ["A UOM with this short code already exists."]
+        )
+
+
+class DamageFormSupplierInvoiceTests(TestCase):
+    """Damage adjustments only offer invoices that supplied the variant."""
+
+    def setUp(self):
+        self.user = create_test_user()
+        self.variant = create_test_variant(user=self.user)
+        supplier = create_test_supplier(user=self.user)
+        self.supplying = create_test_supplier_invoice(supplier=supplier)
+        self.unrelated = create_test_supplier_invoice(supplier=supplier)
+        for _ in range(2):
+            InventoryLog.objects.create(
+                variant=self.variant,
+                transaction_type=InventoryLog.TransactionTypes.STOCK_IN,
+                quantity_change=Decimal("5"),
+                supplier_invoice=self.supplying,
+                created_by=self.user,
+            )
+        InventoryLog.objects.create(
+            variant=self.variant,
+            transaction_type=InventoryLog.TransactionTypes.ADJUSTMENT_IN,
+            quantity_change=Decimal("1"),
+            supplier_invoice=self.unrelated,
+            created_by=self.user,
+        )
+
+    def test_queryset_limited_to_supplying_invoices(self):
+        form = DamageForm(variant=self.variant)
+        self.assertEqual(
+            list(form.fields["supplier_invoice"].queryset), [self.supplying]
+        )
+
+    def test_prefetch_membership_respects_adjustment_type(self):
+        invoices = [self.supplying, self.unrelated]
+        self.assertEqual(
+            DamageForm.prefetch_membership(invoices),
+            {self.supplying.pk: {self.variant.pk}, self.unrelated.pk: frozenset()},
+        )
+        self.assertEqual(
+            AdjustmentOutForm.prefetch_membership(invoices)[self.unrelated.pk],
+            {self.variant.pk},
+        )
+
+    def test_clean_uses_prefetched_membership(self):
+        membership = DamageForm.prefetch_membership([self.supplying, self.unrelated])
+        data = {
+            "quantity_change": "1",
+            "notes": "torn",
+            "supplier_invoice": self.supplying.pk,
+        }
+        counts = []
+        for kwargs in ({}, {"invoice_variants": membership}):
+            form = DamageForm(data=data, variant=self.variant, **kwargs)
+            with CaptureQueriesContext(connection) as ctx:
+                self.assertTrue(form.is_valid(), form.errors)
+            counts.append(len(ctx.captured_queries))
+        self.assertEqual(counts[1], counts[0] - 1)
+
+        empty = create_test_supplier_invoice(supplier=self.supplying.supplier)
+        form = AdjustmentOutForm(
+            data={**data, "supplier_invoice": empty.pk},
+            variant=self.variant,
+            invoice_variants=AdjustmentOutForm.prefetch_membership([empty]),
+        )
+        self.assertFalse(form.is_valid())
+        self.assertIn("does not contain the variant", str(form.errors))
+
+    def test_bulk_clean_shares_one_membership_query(self):
+        def build(count):
+            return [
+                AdjustmentOutForm(
+                    data={
+                        f"{i}-quantity_change": "1",
+                        f"{i}-notes": "recount",
+                        f"{i}-supplier_invoice": self.unrelated.pk,
+                    },
+                    variant=self.variant,
+                    prefix=str(i),
+                )
+                for i in range(count)
+            ]
+
+        query_counts = []
+        for count in (1, 3):
+            forms = build(count)
+            with CaptureQueriesContext(connection) as ctx:
+                self.assertTrue(AdjustmentOutForm.bulk_clean(forms))
+            membership_queries = [
+                q for q in ctx.captured_queries if "variant_id" in q["sql"]
+                and "inventory_inventorylog" in q["sql"]
+            ]
+            query_counts.append(len(membership_queries))
+        self.assertEqual(query_counts, [1, 1])
+
+    def test_selected_variant_is_loaded_with_name_relations(self):
+        empty = create_test_supplier_invoice(supplier=self.supplying.supplier)
+        form = AdjustmentOutForm(
+            data={
+                "variant": self.variant.pk,
+                "supplier_invoice": empty.pk,
+                "quantity_change": "1",
+            }
+        )
+        self.assertFalse(form.is_valid())
+        variant = form.cleaned_data["variant"]
+        with self.assertNumQueries(0):
+            self.assertIn(variant.full_name, str(form.errors))
+
+    def test_supplier_invoice_can_be_omitted(self):
+        form = AdjustmentOutForm(
+            data={"quantity_change": "1", "notes": "recount"},
+            variant=self.variant,
+            show_supplier_invoice=False,
+        )
+        self.assertNotIn("supplier_invoice", form.fields)
+        with CaptureQueriesContext(connection) as ctx:
+            self.assertTrue(form.is_valid(), form.errors)
+        self.assertFalse(
+            any("supplier_invoice" in q["sql"] for q in ctx.captured_queries)
+        )
+
+
+class StockInPurchasePriceTests(TestCase):
+    """Stock-in purchase price is checked on the field, not via a constraint query."""
+
+    def setUp(self):
+        self.user = create_test_user()
+        self.variant = create_test_variant(user=self.user)
+
+    def test_negative_purchase_price_rejected_by_form(self):
+        form = StockInForm(
+            data={"quantity_change": "5", "purchase_price": "-1", "mrp": "200"},
+            variant=self.variant,
+        )
+        self.assertFalse(form.is_valid())
+        self.assertIn("Purchase price cannot be negative.", form.errors["purchase_price"])
+
+    def test_valid_form_skips_constraint_query(self):
+        form = StockInForm(
+            data={"quantity_change": "5", "purchase_price": "100", "mrp": "200"},
+            variant=self.variant,
+        )
+        with CaptureQueriesContext(connection) as ctx:
+            self.assertTrue(form.is_valid(), form.errors)
+        self.assertFalse(any("_check" in q["sql"] for q in ctx.captured_queries))
+
+
+class FormInputClassTests(TestCase):
+    """FormInputMeta stamps widget CSS classes on the class-level fields."""
+
+    def test_instances_receive_theme_classes(self):
+        form = UOMForm()
+        self.assertEqual(form.fields["name"].widget.attrs["class"], "form-input")
+        self.assertEqual(
+            form.fields["is_active"].widget.attrs["class"], "form-check-input"
+        )
+        self.assertEqual(UOMForm.base_fields["name"].widget.attrs["class"], "form-input")
+
+    def test_type_and_field_overrides(self):
+        stock_in = StockInForm()
+        self.assertEqual(
+            stock_in.fields["notes"].widget.attrs["class"], "form-input multiline"
+        )
+        self.assertEqual(stock_in.fields["mrp"].widget.attrs["min"], "0")
+        price = InventoryPriceUpdateForm()
+        self.assertEqual(
+            price.fields["mrp"].widget.attrs["class"], "form-input indian-number"
+        )
+
+    def test_instance_changes_do_not_leak(self):
+        first = StockInForm()
+        first.fields["notes"].widget.attrs["class"] = "changed"
+        self.assertEqual(
+            StockInForm().fields["notes"].widget.attrs["class"], "form-input multiline"
+        )
+
+
+class CodeFormatValidationTests(TestCase):
+    """Hex and HSN codes are validated with precompiled patterns."""
+
+    def test_hex_code_is_normalised(self):
+        form = ColorForm(data={"name": "Teal", "hex_code": " 00ff7f "})
+        self.assertTrue(form.is_valid(), form.errors)
+        self.assertEqual(form.cleaned_data["hex_code"], "#00FF7F")
+
+    def test_invalid_hex_code(self):
+        for value in ("#GG0000", "#FFF", "#FF00AA1"):
+            form = ColorForm(data={"name": "Bad", "hex_code": value})
+            self.assertIn("hex_code", form.errors, value)
+
+    def test_hsn_code_messages(self):
+        cases = {
+            "12AB": "HSN Code must contain only numbers",
+            "123": "HSN Code must be 4-10 digits long",
+        }
+        for value, message in cases.items():
+            form = GSTHsnCodeForm(data={"code": value})
+            self.assertEqual(form.errors["code"], [message], value)
+        form = GSTHsnCodeForm(data={"code": " 6109 "})
+        self.assertNotIn("code", form.errors)
+
+
+class ProductFormLengthTests(TestCase):
+    """Brand/name length limits come from the model field validators."""
+
+    def test_over_long_values_use_custom_messages(self):
+        form = ProductForm(data={"brand": "B" * 256, "name": "N" * 256})
+        self.assertEqual(
+            form.errors["brand"], ["Brand name must be less than 255 characters long"]
+        )
+        self.assertEqual(
+            form.errors["name"], ["Product name must be less than 255 characters long"]
+        )
+
+
+class ProductFormActiveChoicesTests(TestCase):
+    """HSN code and UOM dropdowns come from the cache once warmed."""
+
+    def setUp(self):
+        cache.delete_many([HSN_CHOICES_KEY, HSN_GST_RATES_KEY, UOM_CHOICES_KEY])
+        self.hsn = create_test_hsn_code(gst_percentage=Decimal("12.00"))
+        create_test_hsn_code()
+        self.uom = UOM.objects.create(name="Piece", short_code="PCS", category="Quantity")
+
+    def test_warm_form_needs_no_queries(self):
+        str(ProductForm())
+        with CaptureQueriesContext(connection) as ctx:
+            form = ProductForm()
+            html = str(form["hsn_code"]) + str(form["uom"])
+        self.assertEqual(len(ctx.captured_queries), 0)
+        self.assertEqual(form.fields["hsn_code"].initial, self.hsn.pk)
+        self.assertEqual(form.fields["uom"].initial, self.uom.pk)
+        self.assertIn('data-gst-percentage="12.00"', html)
+
+    def test_changes_invalidate_cached_choices(self):
+        str(ProductForm())
+        self.hsn.is_active = False
+        self.hsn.save()
+        form = ProductForm()
+        self.assertNotIn(f'value="{self.hsn.pk}"', str(form["hsn_code"]))
+        self.assertNotEqual(form.fields["hsn_code"].initial, self.hsn.pk)
+
+
+class AdjustmentFormLabelTests(TestCase):
+    """Each adjustment form class carries its own labels and transaction type."""
+
+    def test_class_labels(self):
+        self.assertEqual(
+            AdjustmentOutForm().fields["quantity_change"].label, "Quantity to Remove"
+        )
+        damage = DamageForm()
+        self.assertEqual(
+            damage.fields["quantity_change"].label, "Quantity to Mark as Damaged"
+        )
+        self.assertEqual(damage.fields["notes"].label, "Damage Details")
+
+    def test_transaction_types(self):
+        self.assertEqual(
+            DamageForm().transaction_type, InventoryLog.TransactionTypes.DAMAGE
+        )
+        self.assertEqual(
+            AdjustmentOutForm(adjustment_type="adjustment_in").transaction_type,
+            InventoryLog.TransactionTypes.ADJUSTMENT_IN,
+        )
+
+    def test_overridden_type_is_relabelled(self):
+        form = AdjustmentOutForm(adjustment_type="damage")
+        self.assertEqual(form.fields["notes"].label, "Damage Details")
+
+
+class FieldCleanerFactoryTests(TestCase):
+    """Generated clean_<field> methods keep their field-specific messages."""
+
+    def test_range_cleaner(self):
+        form = GSTHsnCodeForm(data={"code": "6109", "gst_percentage": "41", "cess_rate": "-1"})
+        self.assertEqual(
+            form.errors["gst_percentage"],
+            ["GST percentage must be between 0.00 and 40.00"],
+        )
+        self.assertEqual(
+            form.errors["cess_rate"], ["Cess rate must be between 0.00 and 25.00"]
+        )
+
+    def test_positive_cleaner(self):
+        form = InventoryPriceUpdateForm(data={"mrp": "0", "discount_percentage": "0"})
+        self.assertEqual(form.errors["mrp"], ["Selling price must be greater than 0"])
+        self.assertEqual(
+            InventoryPriceUpdateForm.clean_mrp.__doc__, "Validate mrp is greater than 0"
+        )
+
+
+class ConstraintBackedFieldTests(TestCase):
+    """Variant forms check constraint-backed prices without constraint queries."""
+
+    def setUp(self):
+        self.variant = create_test_variant()
+
+    def test_variant_form_skips_constraint_queries(self):
+        form = VariantForm(
+            data={
+                "quantity": "5",
+                "minimum_quantity": "1",
+                "purchase_price": "100",
+                "mrp": "200",
+                "discount_percentage": "0",
+                "commission_percentage": "1",
+            }
+        )
+        with CaptureQueriesContext(connection) as ctx:
+            self.assertTrue(form.is_valid(), form.errors)
+        self.assertFalse(any("_check" in q["sql"] for q in ctx.captured_queries))
+
+    def test_admin_form_reports_negative_damaged_quantity_on_field(self):
+        form = ProductVariantAdminForm(
+            data={"damaged_quantity": "-1"}, instance=self.variant
+        )
+        self.assertFalse(form.is_valid())
+        self.assertEqual(
+            form.errors["damaged_quantity"], ["Damaged quantity cannot be negative."]
+        )
+        self.assertNotIn("__all__", form.errors)
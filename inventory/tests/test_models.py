@@ -0,0 +1,263 @@
+"""Tests for inventory/models.py save-time validation and the variant manager."""
+
+from decimal import Decimal
+
+from django.db import IntegrityError, connection, models, transaction
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+
+from Billing.tests.helpers import (
+    create_test_category,
+    create_test_hsn_code,
+    create_test_product,
+    create_test_user,
+    create_test_variant,
+)
+from inventory.models import (
+    Color,
+    FavoriteVariant,
+    InventoryLog,
+    ProductVariant,
+    Size,
+)
+
+
+class ProductVariantSaveTests(TestCase):
+    """Tests for barcode handling in ProductVariant.save()."""
+
+    BARCODE_LOOKUP = '"inventory_productvariant"."barcode" ='
+
+    def setUp(self):
+        self.variant = create_test_variant()
+
+    def _barcode_lookups(self, **save_kwargs):
+        with CaptureQueriesContext(connection) as ctx:
+            self.variant.save(**save_kwargs)
+        return [q for q in ctx.captured_queries if self.BARCODE_LOOKUP in q["sql"]]
+
+    def test_save_does_not_probe_barcode(self):
+        self.variant.quantity = Decimal("7")
+        self.assertEqual(self._barcode_lookups(update_fields=["quantity"]), [])
+        self.assertEqual(self._barcode_lookups(), [])
+        self.variant.refresh_from_db()
+        self.assertEqual(self.variant.quantity, Decimal("7"))
+
+    def test_new_variant_gets_id_based_barcode(self):
+        variant = ProductVariant.objects.create(product=create_test_product())
+        self.assertEqual(variant.barcode, f"{variant.pk:06d}3")
+        variant.refresh_from_db()
+        self.assertEqual(variant.barcode, f"{variant.pk:06d}3")
+
+    def test_full_save_rejects_duplicate_barcode(self):
+        other = create_test_variant()
+        other.barcode = self.variant.barcode
+        with self.assertRaises(IntegrityError), transaction.atomic():
+            other.save()
+
+    def test_barcode_update_rejects_duplicate(self):
+        other = create_test_variant()
+        other.barcode = self.variant.barcode
+        with self.assertRaises(IntegrityError), transaction.atomic():
+            other.save(update_fields=["barcode"])
+
+
+class ProductVariantManagerTests(TestCase):
+    """Tests for the related-row joins on ProductVariant manager lookups."""
+
+    def setUp(self):
+        self.category = create_test_category()
+        for _ in range(3):
+            create_test_variant(product=create_test_product(category=self.category))
+
+    def test_by_category_joins_product_and_category(self):
+        with self.assertNumQueries(1):
+            names = [
+                (variant.product.brand, variant.product.category.name)
+                for variant in ProductVariant.objects.by_category(self.category)
+            ]
+        self.assertEqual(len(names), 3)
+
+    def test_slim_renders_listing_rows_in_one_query(self):
+        with self.assertNumQueries(1):
+            rows = [
+                (variant.full_name, variant.quantity, variant.mrp)
+                for variant in ProductVariant.objects.in_stock().slim()
+            ]
+        self.assertEqual(len(rows), 3)
+
+    def test_stock_level_helpers(self):
+        empty, low, stocked = ProductVariant.objects.order_by("pk")
+        ProductVariant.objects.filter(pk=empty.pk).update(quantity=0)
+        ProductVariant.objects.filter(pk=low.pk).update(minimum_quantity=60)
+        self.assertEqual(set(ProductVariant.objects.low_stock()), {empty, low})
+        self.assertEqual(list(ProductVariant.objects.out_of_stock()), [empty])
+        self.assertEqual(set(ProductVariant.objects.in_stock()), {low, stocked})
+
+    def test_by_price_range_bounds(self):
+        cheap, mid, dear = ProductVariant.objects.order_by("pk")
+        for variant, mrp in [(cheap, 100), (mid, 200), (dear, 300)]:
+            ProductVariant.objects.filter(pk=variant.pk).update(mrp=mrp)
+        by_range = ProductVariant.objects.by_price_range
+        self.assertEqual(set(by_range(min_price=150)), {mid, dear})
+        self.assertEqual(set(by_range(max_price=250)), {cheap, mid})
+        self.assertEqual(list(by_range(150, 250)), [mid])
+        self.assertEqual(by_range().count(), 3)
+
+    def test_with_related_chains_after_filters(self):
+        with self.assertNumQueries(1):
+            variants = list(ProductVariant.objects.in_stock().with_related())
+            [str(variant) for variant in variants]
+        self.assertEqual(len(variants), 3)
+
+    def test_with_related_reads_gst_percentage_without_queries(self):
+        variant = ProductVariant.objects.with_related().first()
+        with self.assertNumQueries(0):
+            first = variant.actual_purchased_price
+            second = variant.actual_purchased_price
+        self.assertEqual(first, second)
+
+    def test_gst_percentage_follows_hsn_reassignment(self):
+        variant = ProductVariant.objects.with_related().first()
+        self.assertEqual(variant.get_gst_percentage, Decimal("5.00"))
+        variant.product.hsn_code = create_test_hsn_code(gst_percentage=Decimal("12.00"))
+        self.assertEqual(variant.get_gst_percentage, Decimal("12.00"))
+
+    def test_by_attrs_combines_filters(self):
+        first, second, third = ProductVariant.objects.order_by("pk")
+        size = Size.objects.create(name="M")
+        color = Color.objects.create(name="Red")
+        ProductVariant.objects.filter(pk__in=[first.pk, second.pk]).update(size=size)
+        ProductVariant.objects.filter(pk__in=[second.pk, third.pk]).update(
+            color=color
+        )
+        self.assertEqual(
+            list(ProductVariant.objects.by_attrs(size=size, color=color)), [second]
+        )
+        self.assertEqual(set(ProductVariant.objects.by_size(size)), {first, second})
+        self.assertEqual(set(ProductVariant.objects.by_color(color)), {second, third})
+
+    def test_by_attrs_defaults_to_active(self):
+        inactive = ProductVariant.objects.order_by("pk").first()
+        ProductVariant.objects.filter(pk=inactive.pk).update(status="DISCONTINUED")
+        self.assertNotIn(inactive, ProductVariant.objects.by_attrs())
+        self.assertEqual(
+            list(ProductVariant.objects.by_status("DISCONTINUED")), [inactive]
+        )
+
+    def test_by_attrs_rejects_unknown_keys(self):
+        with self.assertRaises(ValueError):
+            ProductVariant.objects.by_attrs(mrp__gte=100)
+
+
+class FavoriteVariantManagerTests(TestCase):
+    """Tests for the joined default queryset on FavoriteVariant."""
+
+    def test_listing_favourites_is_one_query(self):
+        user = create_test_user()
+        size = Size.objects.create(name="M")
+        color = Color.objects.create(name="Red")
+        for _ in range(3):
+            variant = create_test_variant()
+            ProductVariant.objects.filter(pk=variant.pk).update(size=size, color=color)
+            FavoriteVariant.objects.create(user=user, variant=variant)
+        with self.assertNumQueries(1):
+            labels = [str(favourite) for favourite in FavoriteVariant.objects.all()]
+        self.assertEqual(len(labels), 3)
+        self.assertTrue(all("M, Red" in label for label in labels))
+
+
+class InventoryLogStockSummaryTests(TestCase):
+    """Tests for InventoryLogQuerySet.with_stock_summary()."""
+
+    def setUp(self):
+        self.variant = create_test_variant()
+        for transaction_type, quantity_change in [
+            (InventoryLog.TransactionTypes.INITIAL, Decimal("10")),
+            (InventoryLog.TransactionTypes.STOCK_IN, Decimal("5")),
+            (InventoryLog.TransactionTypes.SALE, Decimal("-4")),
+            (InventoryLog.TransactionTypes.RETURN, Decimal("1")),
+        ]:
+            InventoryLog.objects.create(
+                variant=self.variant,
+                transaction_type=transaction_type,
+                quantity_change=quantity_change,
+                new_quantity=Decimal("0"),
+            )
+
+    def test_buckets_are_summed_per_group(self):
+        summary = (
+            InventoryLog.objects.values("variant_id").with_stock_summary().get()
+        )
+        self.assertEqual(summary["stock_in_quantity"], Decimal("15"))
+        self.assertEqual(summary["sales_quantity"], Decimal("-3"))
+        self.assertEqual(summary["damage_quantity"], Decimal("0"))
+
+    def test_shared_annotations_survive_repeated_use(self):
+        grouped = InventoryLog.objects.values("variant_id").with_stock_summary()
+        first, second = grouped.get(), grouped.all().get()
+        self.assertEqual(first, second)
+        totals = InventoryLog.objects.with_stock_summary().aggregate(
+            total=models.Sum("stock_in_quantity")
+        )
+        self.assertEqual(totals["total"], Decimal("15"))
+
+    def test_summary_by_variant_groups_in_one_query(self):
+        other = create_test_variant()
+        InventoryLog.objects.create(
+            variant=other,
+            transaction_type=InventoryLog.TransactionTypes.DAMAGE,
+            quantity_change=Decimal("-2"),
+            new_quantity=Decimal("0"),
+        )
+        with self.assertNumQueries(1):
+            summaries = {
+                row["variant_id"]: row
+                for row in InventoryLog.objects.stock_summary_by_variant(
+                    [self.variant.pk, other.pk]
+                )
+            }
+        self.assertEqual(summaries[self.variant.pk]["stock_in_quantity"], Decimal("15"))
+        self.assertEqual(summaries[other.pk]["damage_quantity"], Decimal("-2"))
+        self.assertEqual(summaries[other.pk]["stock_in_quantity"], Decimal("0"))
+
+
+class InventoryLogBulkTests(TestCase):
+    """Tests for InventoryLogManager.log_bulk()."""
+
+    def setUp(self):
+        self.variant = create_test_variant()
+
+    def _entries(self, count):
+        return [
+            InventoryLog(
+                variant=self.variant,
+                transaction_type=InventoryLog.TransactionTypes.ADJUSTMENT_IN,
+                quantity_change=Decimal("1"),
+                new_quantity=Decimal(index + 1),
+            )
+            for index in range(count)
+        ]
+
+    def test_batch_size_argument_splits_inserts(self):
+        with CaptureQueriesContext(connection) as ctx:
+            InventoryLog.objects.log_bulk(self._entries(5), batch_size=2)
+        inserts = [q for q in ctx.captured_queries if q["sql"].startswith("INSERT")]
+        self.assertEqual(len(inserts), 3)
+        self.assertEqual(InventoryLog.objects.filter(variant=self.variant).count(), 5)
+
+    @override_settings(INVENTORY_LOG_BULK_BATCH_SIZE=3)
+    def test_batch_size_defaults_to_setting(self):
+        with CaptureQueriesContext(connection) as ctx:
+            InventoryLog.objects.log_bulk(self._entries(5))
+        inserts = [q for q in ctx.captured_queries if q["sql"].startswith("INSERT")]
+        self.assertEqual(len(inserts), 2)
+
+    def test_copies_variant_is_deleted_from_loaded_variant(self):
+        self.variant.is_deleted = True
+        InventoryLog.objects.log_bulk(self._entries(2))
+        self.assertEqual(
+            InventoryLog.all_objects.filter(
+                variant=self.variant, variant_is_deleted=True
+            ).count(),
+            2,
+        )
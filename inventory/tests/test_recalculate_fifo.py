@@ -0,0 +1,51 @@
+"""Tests for the recalculate_fifo management command."""
+
+from decimal import Decimal
+from io import StringIO
+
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from Billing.tests.helpers import create_test_user, create_test_variant
+from inventory.models import Color, ProductVariant, Size
+from inventory.services import InventoryService
+
+
+class RecalculateFifoCommandTests(TestCase):
+    """Tests for variant loading and quantity repair in recalculate_fifo."""
+
+    def setUp(self):
+        self.user = create_test_user()
+        self.size = Size.objects.create(name="M")
+        self.color = Color.objects.create(name="Red")
+
+    def _add_variant(self):
+        variant = create_test_variant(quantity=Decimal("5"), user=self.user)
+        variant.size = self.size
+        variant.color = self.color
+        variant.save()
+        InventoryService.create_initial_log(variant, self.user)
+        return variant
+
+    def _run(self, **options):
+        with CaptureQueriesContext(connection) as ctx:
+            call_command("recalculate_fifo", stdout=StringIO(), **options)
+        return len(ctx.captured_queries)
+
+    def test_variant_labels_do_not_query_per_variant(self):
+        self._add_variant()
+        one_variant = self._run(dry_run=True)
+        self._add_variant()
+        self._add_variant()
+        three_variants = self._run(dry_run=True)
+        # Only the per-variant log fetch should scale with the variant count
+        self.assertEqual(three_variants - one_variant, 2)
+
+    def test_execute_repairs_variant_quantity(self):
+        variant = self._add_variant()
+        ProductVariant.objects.filter(pk=variant.pk).update(quantity=Decimal("-1"))
+        self._run(execute=True)
+        variant.refresh_from_db()
+        self.assertEqual(variant.quantity, Decimal("5"))
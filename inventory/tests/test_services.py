@@ -2,13 +2,26 @@
 
 from decimal import Decimal
 
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 from django.utils import timezone
 
-from inventory.services import InventoryService, DamageResolutionService
-from inventory.models import InventoryLog, DamagedItemRecord
+from inventory.services import (
+    BulkUploadService,
+    InventoryService,
+    DamageResolutionService,
+)
+from inventory.models import (
+    BulkUpload,
+    BulkUploadItem,
+    InventoryLog,
+    DamagedItemRecord,
+    ProductVariant,
+)
 from Billing.tests.helpers import (
     create_test_user,
+    create_test_hsn_code,
     create_test_product,
     create_test_variant,
     create_test_supplier,
@@ -176,6 +189,27 @@ class AdjustQuantityTests(TestCase):
         self.assertIsNotNone(log)
         self.assertEqual(log.quantity_change, Decimal("-10"))
 
+    def test_adjust_out_checks_current_stock(self):
+        # Another request has already taken most of the stock
+        ProductVariant.objects.filter(pk=self.variant.pk).update(quantity=Decimal("5"))
+        with self.assertRaises(ValueError) as ctx:
+            InventoryService.adjust_out_quantity(self.variant, 10, user=self.user)
+        self.assertIn("Insufficient stock", str(ctx.exception))
+        self.assertEqual(self.variant.quantity, Decimal("5"))
+        self.assertFalse(
+            InventoryLog.objects.filter(
+                transaction_type=InventoryLog.TransactionTypes.ADJUSTMENT_OUT
+            ).exists()
+        )
+
+    def test_adjust_in_only_writes_quantity(self):
+        # A price edit saved elsewhere must survive a stale stock update
+        ProductVariant.objects.filter(pk=self.variant.pk).update(mrp=Decimal("999.00"))
+        InventoryService.adjust_in_quantity(self.variant, 5, user=self.user)
+        self.variant.refresh_from_db()
+        self.assertEqual(self.variant.mrp, Decimal("999.00"))
+        self.assertEqual(self.variant.quantity, Decimal("55"))
+
 
 class CreateInitialLogTests(TestCase):
     """Tests for InventoryService.create_initial_log()."""
@@ -631,3 +665,89 @@ class LinkSupplierInvoiceTests(TestCase):
             initial_log, self.supplier_invoice, user=self.user
         )
         self.assertGreater(result["child_logs_updated"], 0)
+
+
+class InventoryLogVariantIsDeletedTests(TestCase):
+    """InventoryLog.variant_is_deleted mirrors the variant's soft-delete flag."""
+
+    def setUp(self):
+        self.user = create_test_user()
+        self.variant = create_test_variant(user=self.user)
+        self.log = InventoryService.create_initial_log(self.variant, user=self.user)
+
+    def test_new_log_copies_variant_flag(self):
+        self.assertFalse(self.log.variant_is_deleted)
+
+    def test_soft_delete_and_restore_propagate_to_logs(self):
+        self.variant.soft_delete()
+        self.log.refresh_from_db()
+        self.assertTrue(self.log.variant_is_deleted)
+
+        self.variant.restore()
+        self.log.refresh_from_db()
+        self.assertFalse(self.log.variant_is_deleted)
+
+    def test_plain_save_does_not_touch_logs(self):
+        self.variant.mrp = Decimal("199.00")
+        with CaptureQueriesContext(connection) as ctx:
+            self.variant.save()
+        self.assertFalse(
+            any("inventory_inventorylog" in q["sql"] for q in ctx.captured_queries)
+        )
+
+
+class BulkUploadCommitAllTests(TestCase):
+    """Tests for BulkUploadService.commit_all_items()."""
+
+    def setUp(self):
+        self.user = create_test_user()
+        self.batch = BulkUpload.objects.create(
+            supplier_invoice=create_test_supplier_invoice(create_test_supplier()),
+            created_by=self.user,
+        )
+        self.hsn_code = create_test_hsn_code()
+
+    def _add_item(self, quantity):
+        return BulkUploadItem.objects.create(
+            bulk_upload=self.batch,
+            brand="Acme",
+            name="Shirt",
+            hsn_code=self.hsn_code,
+            quantity=Decimal(quantity),
+            purchase_price=Decimal("100.00"),
+            mrp=Decimal("150.00"),
+        )
+
+    def test_repeated_rows_share_one_variant(self):
+        first = self._add_item("5")
+        second = self._add_item("3")
+
+        with CaptureQueriesContext(connection) as ctx:
+            result = BulkUploadService.commit_all_items(self.batch, self.user)
+
+        self.assertEqual(result["committed_count"], 2)
+        variant_lookups = [
+            q for q in ctx.captured_queries
+            if '"inventory_productvariant"."color_id" IS NULL' in q["sql"]
+        ]
+        self.assertEqual(len(variant_lookups), 1)
+        first.refresh_from_db()
+        second.refresh_from_db()
+        self.assertEqual(first.variant_id, second.variant_id)
+        first.variant.refresh_from_db()
+        self.assertEqual(first.variant.quantity, Decimal("8"))
+
+    def test_cached_rows_do_not_overwrite_explicit_variant_stock(self):
+        product = create_test_product(brand="Acme", name="Shirt", hsn_code=self.hsn_code)
+        variant = create_test_variant(product=product, quantity=Decimal("10"))
+        self._add_item("5")
+        explicit = self._add_item("2")
+        explicit.variant = ProductVariant.objects.get(pk=variant.pk)
+        explicit.save()
+        self._add_item("3")
+
+        result = BulkUploadService.commit_all_items(self.batch, self.user)
+
+        self.assertEqual(result["committed_count"], 3)
+        variant.refresh_from_db()
+        self.assertEqual(variant.quantity, Decimal("20"))
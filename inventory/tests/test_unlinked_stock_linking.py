@@ -294,6 +294,36 @@ class AutoRepairUnlinkedLogsTestCase(TestCase):
         initial_log.refresh_from_db()
         self.assertIsNone(initial_log.supplier_invoice)
 
+    def test_auto_repair_small_batch_size(self):
+        """Every inferred link should be applied when batches are flushed one log at a time."""
+        parent_logs = []
+        for _ in range(2):
+            parent_log = InventoryLog.objects.create(
+                variant=self.variant,
+                transaction_type=InventoryLog.TransactionTypes.STOCK_IN,
+                quantity_change=Decimal("5.00"),
+                new_quantity=Decimal("5.00"),
+                remaining_quantity=Decimal("4.00"),
+                purchase_price=Decimal("600.00"),
+                supplier_invoice=None,
+            )
+            InventoryLog.objects.create(
+                variant=self.variant,
+                transaction_type=InventoryLog.TransactionTypes.SALE,
+                quantity_change=Decimal("-1.00"),
+                new_quantity=Decimal("4.00"),
+                allocated_quantity=Decimal("1.00"),
+                source_inventory_log=parent_log,
+                supplier_invoice=self.invoice,
+            )
+            parent_logs.append(parent_log)
+
+        call_command("repair_unlinked_stock", execute=True, batch_size=1)
+
+        for parent_log in parent_logs:
+            parent_log.refresh_from_db()
+            self.assertEqual(parent_log.supplier_invoice, self.invoice)
+
 
 
 class ReconcileFifoTestCase(TestCase):
@@ -0,0 +1,79 @@
+"""Tests for inventory/views.py summary pages and supplier invoice aggregates."""
+
+from decimal import Decimal
+
+from django.test import RequestFactory, TestCase
+from django.urls import reverse
+
+from Billing.tests.helpers import (
+    create_test_supplier,
+    create_test_supplier_invoice,
+    create_test_user,
+    create_test_variant,
+)
+from inventory.models import InventoryLog, ProductVariant
+from inventory.views import (
+    _supplier_invoice_details_products_qs,
+    _supplier_invoice_queryset,
+    _supplier_invoice_totals,
+)
+
+
+class LowStockPageTests(TestCase):
+    """Tests for the low stock page summary counts."""
+
+    def setUp(self):
+        self.user = create_test_user(is_staff=True, is_superuser=True)
+        self.client.force_login(self.user)
+        for quantity in ("0", "2", "8", "50"):
+            variant = create_test_variant(quantity=Decimal(quantity))
+            ProductVariant.objects.filter(pk=variant.pk).update(
+                minimum_quantity=Decimal("10")
+            )
+
+    def test_summary_counts(self):
+        response = self.client.get(reverse("inventory:low_stock"))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.context["total_low_stock"], 3)
+        self.assertEqual(response.context["out_of_stock"], 1)
+        self.assertEqual(response.context["critical_stock"], 2)
+
+
+class SupplierInvoiceAggregateTests(TestCase):
+    """Tests for the supplier invoice tracking aggregates."""
+
+    def setUp(self):
+        self.invoice = create_test_supplier_invoice(create_test_supplier())
+        self.variant = create_test_variant()
+        for transaction_type, quantity_change in [
+            (InventoryLog.TransactionTypes.STOCK_IN, Decimal("10")),
+            (InventoryLog.TransactionTypes.SALE, Decimal("-3")),
+            (InventoryLog.TransactionTypes.DAMAGE, Decimal("-1")),
+        ]:
+            InventoryLog.objects.create(
+                variant=self.variant,
+                supplier_invoice=self.invoice,
+                transaction_type=transaction_type,
+                quantity_change=quantity_change,
+                new_quantity=Decimal("0"),
+                purchase_price=Decimal("20.00"),
+                mrp=Decimal("30.00"),
+            )
+        self.request = RequestFactory().get("/")
+
+    def test_invoice_totals(self):
+        totals = _supplier_invoice_totals(self.invoice.id)
+        self.assertEqual(totals["total_stock_in"], Decimal("10"))
+        self.assertEqual(totals["total_sales"], Decimal("4"))
+        self.assertEqual(totals["total_remaining"], Decimal("6"))
+
+    def test_invoice_list_stock_columns(self):
+        row = _supplier_invoice_queryset(self.request).get(pk=self.invoice.pk)
+        self.assertEqual(row.stock_in_quantity, Decimal("10"))
+        self.assertEqual(row.stock_amount, Decimal("200"))
+
+    def test_invoice_product_prices_come_from_stock_rows(self):
+        row = _supplier_invoice_details_products_qs(self.request, self.invoice.id).get()
+        self.assertEqual(row["purchase_price"], Decimal("20"))
+        self.assertEqual(row["selling_price"], Decimal("30"))
+        self.assertEqual(row["remaining_quantity"], Decimal("6"))
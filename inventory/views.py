@@ -136,7 +136,7 @@ def inventory_dashboard_fetch(request):
 
     # Base queryset for date range
     base_qs = InventoryLog.objects.filter(
-        variant__is_deleted=False, timestamp__gte=start_date, timestamp__lte=end_date
+        variant_is_deleted=False, timestamp__gte=start_date, timestamp__lte=end_date
     )
 
     # Get both stock_in and stock_out totals in a single query using conditional aggregation
@@ -305,11 +305,11 @@ def _calculate_total_stock_by_supplier():
 
     for item in stock_by_supplier:
         supplier_name = item["supplier_name"] or "Others"
-        value = float(item["total_value"] or 0)
+        total_value = item["total_value"] or Decimal("0")
 
         labels.append(supplier_name)
-        values.append(round(value, 2))
-        total_stock_value += Decimal(str(value))
+        values.append(round(float(total_value), 2))
+        total_stock_value += total_value
 
     # Calculate percentages
     total_float = float(total_stock_value)
@@ -338,7 +338,7 @@ def low_stock_page(request):
             minimum_quantity__gt=0,
             quantity__lte=F("minimum_quantity"),
         )
-        .select_related("product")
+        .slim()
         .order_by("quantity")
     )
 
@@ -349,12 +349,14 @@ def low_stock_page(request):
     page_number = request.GET.get("page")
     page_obj = paginator.get_page(page_number)
 
-    # Calculate summary stats
-    total_low_stock = low_stock_variants.count()
-    out_of_stock = low_stock_variants.filter(quantity=0).count()
-    critical_stock = low_stock_variants.filter(
-        quantity__lt=F("minimum_quantity") * 0.5
-    ).count()
+    # Calculate summary stats; the paginator has already counted the rows
+    total_low_stock = paginator.count
+    stock_counts = low_stock_variants.order_by().aggregate(
+        out_of_stock=Count("pk", filter=Q(quantity=0)),
+        critical_stock=Count(
+            "pk", filter=Q(quantity__lt=F("minimum_quantity") * 0.5)
+        ),
+    )
 
     # Add critical threshold to each variant for template use
     for variant in page_obj:
@@ -363,8 +365,8 @@ def low_stock_page(request):
     context = {
         "page_obj": page_obj,
         "total_low_stock": total_low_stock,
-        "out_of_stock": out_of_stock,
-        "critical_stock": critical_stock,
+        "out_of_stock": stock_counts["out_of_stock"],
+        "critical_stock": stock_counts["critical_stock"],
         "title": "Low Stock Items",
     }
 
@@ -724,17 +726,9 @@ def _supplier_invoice_queryset(request):
     supplier_invoices = supplier_invoices.annotate(
         stock_in_quantity=Coalesce(
             Sum(
-                Case(
-                    When(
-                        inventory_logs__transaction_type__in=[
-                            "STOCK_IN",
-                            "INITIAL",
-                        ],
-                        then=F("inventory_logs__quantity_change"),
-                    ),
-                    default=Decimal("0"),
-                    output_field=models.DecimalField(),
-                )
+                "inventory_logs__quantity_change",
+                filter=Q(inventory_logs__transaction_type__in=["STOCK_IN", "INITIAL"]),
+                output_field=models.DecimalField(),
             ),
             Decimal("0"),
         ),
@@ -761,21 +755,10 @@ def _supplier_invoice_queryset(request):
         ),
         stock_amount=Coalesce(
             Sum(
-                Case(
-                    When(
-                        inventory_logs__transaction_type__in=[
-                            "STOCK_IN",
-                            "INITIAL",
-                        ],
-                        then=ExpressionWrapper(
-                            F("inventory_logs__quantity_change")
-                            * F("inventory_logs__purchase_price"),
-                            output_field=DecimalField(max_digits=16, decimal_places=2),
-                        ),
-                    ),
-                    default=Value(0),
-                    output_field=DecimalField(max_digits=16, decimal_places=2),
-                )
+                F("inventory_logs__quantity_change")
+                * F("inventory_logs__purchase_price"),
+                filter=Q(inventory_logs__transaction_type__in=["STOCK_IN", "INITIAL"]),
+                output_field=DecimalField(max_digits=16, decimal_places=2),
             ),
             Value(0),
             output_field=DecimalField(max_digits=16, decimal_places=2),
@@ -845,27 +828,17 @@ def _supplier_invoice_totals(invoice_id):
     totals = InventoryLog.objects.filter(supplier_invoice_id=invoice_id).aggregate(
         total_sales=Coalesce(
             Sum(
-                Case(
-                    When(
-                        transaction_type__in=["SALE", "RETURN", "CANCEL", "DAMAGE"],
-                        then=F("quantity_change"),
-                    ),
-                    default=Decimal("0"),
-                    output_field=quantity_field,
-                )
+                "quantity_change",
+                filter=Q(transaction_type__in=["SALE", "RETURN", "CANCEL", "DAMAGE"]),
+                output_field=quantity_field,
             ),
             Decimal("0"),
         ),
         total_stock_in=Coalesce(
             Sum(
-                Case(
-                    When(
-                        transaction_type__in=["STOCK_IN", "INITIAL"],
-                        then=F("quantity_change"),
-                    ),
-                    default=Decimal("0"),
-                    output_field=quantity_field,
-                )
+                "quantity_change",
+                filter=Q(transaction_type__in=["STOCK_IN", "INITIAL"]),
+                output_field=quantity_field,
             ),
             Decimal("0"),
         ),
@@ -904,28 +877,18 @@ def _supplier_invoice_details_products_qs(request, invoice_id):
         .annotate(
             purchase_price=Coalesce(
                 Sum(
-                    Case(
-                        When(
-                            transaction_type__in=["STOCK_IN", "INITIAL"],
-                            then=F("purchase_price"),
-                        ),
-                        default=Value(0),
-                        output_field=quantity_field,
-                    )
+                    "purchase_price",
+                    filter=Q(transaction_type__in=["STOCK_IN", "INITIAL"]),
+                    output_field=quantity_field,
                 ),
                 Value(0),
                 output_field=quantity_field,
             ),
             selling_price=Coalesce(
                 Sum(
-                    Case(
-                        When(
-                            transaction_type__in=["STOCK_IN", "INITIAL"],
-                            then=F("mrp"),
-                        ),
-                        default=Value(0),
-                        output_field=quantity_field,
-                    )
+                    "mrp",
+                    filter=Q(transaction_type__in=["STOCK_IN", "INITIAL"]),
+                    output_field=quantity_field,
                 ),
                 Value(0),
                 output_field=quantity_field,
@@ -682,10 +682,14 @@ class AdjustmentInCreate(RequiredPermissionMixin, CreateView):
     def get_form_kwargs(self):
         """Pass variant to form constructor"""
         kwargs = super().get_form_kwargs()
+        # Adjustments are not linked to supplier invoices
+        kwargs["show_supplier_invoice"] = False
         variant_id = self.kwargs.get("variant_id")
         if variant_id:
             try:
-                variant = ProductVariant.objects.get(id=variant_id, is_deleted=False)
+                variant = ProductVariant.objects.select_related(
+                    "product", "size", "color"
+                ).get(id=variant_id, is_deleted=False)
                 kwargs["variant"] = variant
             except ProductVariant.DoesNotExist:
                 messages.error(self.request, "Selected variant not found.")
@@ -774,10 +778,14 @@ class AdjustmentOutCreate(RequiredPermissionMixin, CreateView):
     def get_form_kwargs(self):
         """Pass variant to form constructor"""
         kwargs = super().get_form_kwargs()
+        # Adjustments are not linked to supplier invoices
+        kwargs["show_supplier_invoice"] = False
         variant_id = self.kwargs.get("variant_id")
         if variant_id:
             try:
-                variant = ProductVariant.objects.get(id=variant_id, is_deleted=False)
+                variant = ProductVariant.objects.select_related(
+                    "product", "size", "color"
+                ).get(id=variant_id, is_deleted=False)
                 kwargs["variant"] = variant
             except ProductVariant.DoesNotExist:
                 messages.error(self.request, "Selected variant not found.")
@@ -869,7 +877,9 @@ class DamageCreate(RequiredPermissionMixin, CreateView):
         variant_id = self.kwargs.get("variant_id")
         if variant_id:
             try:
-                variant = ProductVariant.objects.get(id=variant_id)
+                variant = ProductVariant.objects.select_related(
+                    "product", "size", "color"
+                ).get(id=variant_id)
                 kwargs["variant"] = variant
             except ProductVariant.DoesNotExist as e:
                 logger.error("Selected variant not found: %s", e)